@@ -3,23 +3,30 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+import codecs
+from collections.abc import AsyncIterator, Callable, Coroutine
 import contextlib
+from contextvars import ContextVar
+from copy import deepcopy
 from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
 from http.cookies import Morsel
 from ipaddress import IPv4Address, IPv6Address
 import logging
 from pathlib import Path
-import sys
+import random
+import re
+import ssl
 from tempfile import gettempdir
 import time
-from typing import Any, Literal, Optional, Union, cast
-from urllib.parse import urljoin
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
 from uuid import UUID
 
 import aiofiles
 import aiohttp
-from aiohttp import CookieJar, client_exceptions
+from aiohttp import CookieJar, client_exceptions, hdrs
 import orjson
 from yarl import URL
 
@@ -47,11 +54,14 @@ from pyunifiprotect.data import (
     create_from_unifi_dict,
 )
 from pyunifiprotect.data.base import ProtectModelWithId
+from pyunifiprotect.data.convert import MODEL_TO_CLASS
 from pyunifiprotect.data.devices import Chime
 from pyunifiprotect.data.types import IteratorCallback, ProgressCallback, RecordingMode
 from pyunifiprotect.exceptions import BadRequest, NotAuthorized, NvrError
 from pyunifiprotect.utils import (
+    create_ssl_context,
     decode_token_cookie,
+    dict_merge,
     get_response_reason,
     ip_from_host,
     set_debug,
@@ -60,13 +70,49 @@ from pyunifiprotect.utils import (
 )
 from pyunifiprotect.websocket import Websocket
 
+if TYPE_CHECKING:
+    from aiofiles.threadpool.binary import AsyncBufferedIOBase
+
 TOKEN_COOKIE_MAX_EXP_SECONDS = 60
+# connection pool settings for the NVR session, all requests go to a single host
+# so keep a small pool of keep-alive connections around to avoid TLS handshakes
+CONNECTION_LIMIT_PER_HOST = 16
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+# responses larger than this are read into a single preallocated buffer
+STREAM_READ_MIN_SIZE = 256 * 1024
+STREAM_READ_CHUNK_SIZE = 65536
 
 NEVER_RAN = -1000
+# device updates buffered by `ProtectApiClient.batch_updates`, keyed by client; kept in
+# a ContextVar so only the task that opened the batch (and tasks it spawns) is captured
+_UPDATE_BATCHES: ContextVar[
+    Optional[dict[ProtectApiClient, dict[tuple[ModelType, str], dict[str, Any]]]]
+] = ContextVar("_UPDATE_BATCHES", default=None)
 # how many seconds before the bootstrap is refreshed from Protect
 DEVICE_UPDATE_INTERVAL = 900
 # retry timeout for thumbnails/heatmaps
 RETRY_TIMEOUT = 10
+# exponential backoff (in seconds) between thumbnail/heatmap retries
+RETRY_DELAY_MIN = 0.1
+RETRY_DELAY_MAX = 1.0
+RETRY_DELAY_FACTOR = 1.5
+# page size and max number of in-flight pages for manual event pagination
+EVENT_PAGE_SIZE = 100
+EVENT_PAGE_MAX_BATCH = 4
+# recording modes replaced by "detections" in Protect 1.20.0
+_STALE_RECORDING_MODES = frozenset({"motion", "smartDetect"})
+# model types fetched by get_all_devices
+DEVICE_MODEL_TYPES = (
+    ModelType.CAMERA,
+    ModelType.LIGHT,
+    ModelType.SENSOR,
+    ModelType.DOORLOCK,
+    ModelType.CHIME,
+    ModelType.VIEWPORT,
+    ModelType.BRIDGE,
+    ModelType.LIVEVIEW,
+)
 PROTECT_APT_URLS = [
     "https://apt.artifacts.ui.com/dists/stretch/release/binary-arm64/Packages",
     "https://apt.artifacts.ui.com/dists/bullseye/release/binary-arm64/Packages",
@@ -78,6 +124,52 @@ If your Protect instance has a lot of events, this request will take much longer
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=64)
+def _enum_values(items: tuple[Enum, ...]) -> tuple[Any, ...]:
+    """Cached query param values for a list of enum filters."""
+    return tuple(e.value for e in items)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+@lru_cache(maxsize=8)
+def _package_version_re(package: str) -> re.Pattern[str]:
+    """Matches the version of every `package` entry in an apt Packages file."""
+    return re.compile(
+        rf"^Package: {re.escape(package)}\n(?:(?!Package: )[^\n]*\n)*?Version: (\S+)",
+        re.MULTILINE,
+    )
+
+
+def _snapshot_params(
+    width: Optional[int],
+    height: Optional[int],
+    dt: Optional[datetime],
+) -> dict[str, Any]:
+    """Query params for a live (forced) or recording snapshot."""
+    if dt is None:
+        params: dict[str, Any] = {"ts": to_js_time(utc_now()), "force": "true"}
+    else:
+        params = {"ts": to_js_time(dt)}
+    if width is not None:
+        params["w"] = width
+    if height is not None:
+        params["h"] = height
+    return params
+
+
+class _InflightRequest:
+    """A request that is shared by all concurrent callers for the same URL."""
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+        self.claimed = False
+
+
 # TODO: Urls to still support
 # Backups
 # * GET /backups - list backends
@@ -140,14 +232,25 @@ class BaseApiClient:
     _username: str
     _password: str
     _verify_ssl: bool
+    _ssl_context: Union[bool, ssl.SSLContext]
     _ws_timeout: int
+    _api_base: URL
+    _ws_base_url: str
 
     _is_authenticated: bool = False
     _last_update: float = NEVER_RAN
     _last_ws_status: bool = False
     _last_token_cookie: Morsel[str] | None = None
     _last_token_cookie_decode: Optional[dict[str, Any]] = None
+    # explicit cookie header for TOKEN, None until checked against the cookie jar
+    _token_cookie_header: Optional[str] = None
+    _token_valid_until: float = 0.0
     _session: Optional[aiohttp.ClientSession] = None
+    _connector: Optional[aiohttp.TCPConnector] = None
+    _cached_ws_url: Optional[str] = None
+    _cached_last_update_id: Optional[UUID] = None
+    # last URL set on the websocket, separate from the `ws_url` cache
+    _ws_pushed_url: Optional[str] = None
 
     headers: Optional[dict[str, str]] = None
     _websocket: Optional[Websocket] = None
@@ -172,6 +275,8 @@ class BaseApiClient:
         self._username = username
         self._password = password
         self._verify_ssl = verify_ssl
+        # built once and shared by every connection so TLS sessions can be reused
+        self._ssl_context = create_ssl_context(verify_ssl)
         self._ws_timeout = ws_timeout
 
         if session is not None:
@@ -187,18 +292,33 @@ class BaseApiClient:
             self._url = URL(f"https://{self._host}")
 
         self.base_url = str(self._url)
+        self._api_base = self._url / self.api_path.strip("/")
+        if self._port != 443:
+            self._ws_base_url = f"wss://{self._host}:{self._port}{self.ws_path}"
+        else:
+            self._ws_base_url = f"wss://{self._host}{self.ws_path}"
+        self._invalidate_ws_url()
+
+    def _invalidate_ws_url(self) -> None:
+        """Clears the cached Websocket URL so it is rebuilt on next access."""
+        self._cached_ws_url = None
 
     @property
     def ws_url(self) -> str:
-        url = f"wss://{self._host}"
-        if self._port != 443:
-            url += f":{self._port}"
-
-        url += self.ws_path
         last_update_id = self._get_last_update_id()
-        if last_update_id is None:
-            return url
-        return f"{url}?lastUpdateId={last_update_id}"
+        if (
+            self._cached_ws_url is not None
+            and last_update_id == self._cached_last_update_id
+        ):
+            return self._cached_ws_url
+
+        url = self._ws_base_url
+        if last_update_id is not None:
+            url = f"{url}?lastUpdateId={self._get_last_update_id_str()}"
+
+        self._cached_ws_url = url
+        self._cached_last_update_id = last_update_id
+        return url
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Gets or creates current client session"""
@@ -206,11 +326,71 @@ class BaseApiClient:
         if self._session is None or self._session.closed:
             if self._session is not None and self._session.closed:
                 _LOGGER.debug("Session was closed, creating a new one")
+            # keep-alive connection pool that lives as long as the session does
+            self._connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+                force_close=False,
+            )
             # need unsafe to access httponly cookies
-            self._session = aiohttp.ClientSession(cookie_jar=CookieJar(unsafe=True))
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                cookie_jar=CookieJar(unsafe=True),
+                json_serialize=_orjson_dumps,
+            )
+            # the new cookie jar is empty
+            self._token_cookie_header = None
 
         return self._session
 
+    def _get_websocket_headers(self) -> Optional[dict[str, str]]:
+        """
+        Headers for the Websocket connection.
+
+        The Websocket does not share the API session, so the auth cookies
+        have to be passed explicitly.
+        """
+        cookies: dict[str, str] = {}
+        if self._session is not None:
+            cookies = {
+                name: morsel.value
+                for name, morsel in self._session.cookie_jar.filter_cookies(
+                    self._url,
+                ).items()
+            }
+        if "TOKEN" not in cookies and self._last_token_cookie is not None:
+            # the cookie jar of a session passed in may not store cookies for IP hosts
+            cookies["TOKEN"] = self._last_token_cookie.value
+        if not cookies:
+            return self.headers
+
+        headers = dict(self.headers or {})
+        headers["cookie"] = "; ".join(
+            f"{name}={value}" for name, value in cookies.items()
+        )
+        return headers
+
+    def _get_token_cookie_header(self, session: aiohttp.ClientSession) -> str:
+        """
+        Cookie header to send the TOKEN cookie with, empty if the session sends it.
+
+        A session passed in by the caller usually has a cookie jar without `unsafe=True`,
+        which silently drops cookies for IP hosts (like most NVRs), so the TOKEN cookie
+        has to be sent explicitly. Only checked once per token.
+        """
+        if self._last_token_cookie is None:
+            return ""
+
+        if self._token_cookie_header is None:
+            if "TOKEN" in session.cookie_jar.filter_cookies(self._url):
+                self._token_cookie_header = ""
+            else:
+                self._token_cookie_header = f"TOKEN={self._last_token_cookie.value}"
+        return self._token_cookie_header
+
     async def get_websocket(self) -> Websocket:
         """Gets or creates current Websocket."""
 
@@ -219,13 +399,15 @@ class BaseApiClient:
                 if self._session is not None:
                     self._session.cookie_jar.clear()
                 self.headers = None
+                self._token_valid_until = 0.0
 
             await self.ensure_authenticated()
-            return self.headers
+            return self._get_websocket_headers()
 
         if self._websocket is None:
+            self._ws_pushed_url = self.ws_url
             self._websocket = Websocket(
-                self.ws_url,
+                self._ws_pushed_url,
                 _auth,
                 verify=self._verify_ssl,
                 timeout=self._ws_timeout,
@@ -240,11 +422,12 @@ class BaseApiClient:
         if self._session is not None:
             await self._session.close()
             self._session = None
+            self._connector = None
 
     async def request(
         self,
         method: str,
-        url: str,
+        url: Union[URL, str],
         require_auth: bool = False,
         auto_close: bool = True,
         **kwargs: Any,
@@ -254,71 +437,116 @@ class BaseApiClient:
         if require_auth:
             await self.ensure_authenticated()
 
-        request_url = self._url.joinpath(url[1:])
-        headers = kwargs.get("headers") or self.headers
-        _LOGGER.debug("Request url: %s", request_url)
-        if not self._verify_ssl:
-            kwargs["ssl"] = False
+        request_url = url if isinstance(url, URL) else self._url.joinpath(url[1:])
+        headers = self.headers
+        if extra_headers := kwargs.pop("headers", None):
+            headers = {**(headers or {}), **extra_headers}
+        if (json_data := kwargs.pop("json", None)) is not None:
+            # serialize with orjson straight to bytes instead of aiohttp's stdlib json
+            kwargs["data"] = orjson.dumps(json_data)
+            headers = {**(headers or {}), hdrs.CONTENT_TYPE: "application/json"}
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Request url: %s", request_url)
         session = await self.get_session()
+        if token_cookie := self._get_token_cookie_header(session):
+            headers = {**(headers or {}), hdrs.COOKIE: token_cookie}
+        # set per request instead of on the connector so requests to other hosts
+        # (like the apt repo) made with the same session are still verified
+        if not self._verify_ssl:
+            kwargs["ssl"] = self._ssl_context
 
-        for attempt in range(2):
+        try:
             try:
-                req_context = session.request(
+                response = await session.request(
+                    method,
+                    request_url,
+                    headers=headers,
+                    **kwargs,
+                )
+            except aiohttp.ServerDisconnectedError:
+                # HTTP/1.1 allows the server to close an idle keep-alive connection
+                # at any time, so try again once on a new connection
+                response = await session.request(
                     method,
                     request_url,
                     headers=headers,
                     **kwargs,
                 )
-                response = await req_context.__aenter__()
 
-                self._update_last_token_cookie(response)
-                if auto_close:
-                    try:
+            self._update_last_token_cookie(response)
+            if auto_close:
+                try:
+                    if debug:
                         _LOGGER.debug(
                             "%s %s %s",
                             response.status,
                             response.content_type,
                             response,
                         )
-                        response.release()
-                    except Exception:
-                        # make sure response is released
-                        response.release()
-                        # re-raise exception
-                        raise
-
-                return response
-            except aiohttp.ServerDisconnectedError as err:
-                # If the server disconnected, try again
-                # since HTTP/1.1 allows the server to disconnect
-                # at any time
-                if attempt == 0:
-                    continue
-                raise NvrError(
-                    f"Error requesting data from {self._host}: {err}",
-                ) from err
-            except client_exceptions.ClientError as err:
-                raise NvrError(
-                    f"Error requesting data from {self._host}: {err}",
-                ) from err
-
-        # should never happen
-        raise NvrError(f"Error requesting data from {self._host}")
+                    response.release()
+                except Exception:
+                    # make sure response is released
+                    response.release()
+                    # re-raise exception
+                    raise
+        except client_exceptions.ClientError as err:
+            raise NvrError(
+                f"Error requesting data from {self._host}: {err}",
+            ) from err
+
+        return response
+
+    async def _read_response(
+        self,
+        response: aiohttp.ClientResponse,
+    ) -> Union[bytes, bytearray]:
+        """Reads the body of a response.
 
-    async def api_request_raw(
+        Large responses with a known size are streamed into a single preallocated
+        buffer instead of being joined together from chunks after the fact.
+        """
+
+        size = response.content_length
+        if (
+            size is None
+            or size <= STREAM_READ_MIN_SIZE
+            # Content-Length is the size of the encoded body
+            or hdrs.CONTENT_ENCODING in response.headers
+        ):
+            return await response.read()
+
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        pos = 0
+        async for chunk in response.content.iter_chunked(STREAM_READ_CHUNK_SIZE):
+            end = pos + len(chunk)
+            if end > size:
+                raise NvrError(f"Response from {self._host} larger than expected")
+            view[pos:end] = chunk
+            pos = end
+        view.release()
+
+        if pos != size:
+            # do not hand back truncated images/videos as if they were complete
+            raise NvrError(
+                f"Response from {self._host} truncated: got {pos} of {size} bytes",
+            )
+        return buffer
+
+    async def _api_request_raw(
         self,
         url: str,
         method: str = "get",
         require_auth: bool = True,
         raise_exception: bool = True,
         **kwargs: Any,
-    ) -> Optional[bytes]:
-        """Make a request to UniFi Protect API"""
-
-        url = urljoin(self.api_path, url)
+    ) -> Optional[Union[bytes, bytearray]]:
+        request_url = self._api_base / url
+        url = request_url.path
         response = await self.request(
             method,
-            url,
+            request_url,
             require_auth=require_auth,
             auto_close=False,
             **kwargs,
@@ -337,7 +565,7 @@ class BaseApiClient:
                 _LOGGER.debug(msg, url, response.status, reason)
                 return None
 
-            data: Optional[bytes] = await response.read()
+            data = await self._read_response(response)
             response.release()
 
             return data
@@ -347,6 +575,28 @@ class BaseApiClient:
             # re-raise exception
             raise
 
+    async def api_request_raw(
+        self,
+        url: str,
+        method: str = "get",
+        require_auth: bool = True,
+        raise_exception: bool = True,
+        **kwargs: Any,
+    ) -> Optional[Union[bytes, bytearray]]:
+        """Make a request to UniFi Protect API
+
+        Large responses are returned as the `bytearray` they were read into to avoid
+        copying them again.
+        """
+
+        return await self._api_request_raw(
+            url=url,
+            method=method,
+            require_auth=require_auth,
+            raise_exception=raise_exception,
+            **kwargs,
+        )
+
     async def api_request(
         self,
         url: str,
@@ -355,7 +605,8 @@ class BaseApiClient:
         raise_exception: bool = True,
         **kwargs: Any,
     ) -> Optional[Union[list[Any], dict[str, Any]]]:
-        data = await self.api_request_raw(
+        # orjson can decode the buffer directly, no need to copy it into `bytes`
+        data = await self._api_request_raw(
             url=url,
             method=method,
             require_auth=require_auth,
@@ -428,9 +679,9 @@ class BaseApiClient:
 
             if self._session is not None:
                 self._session.cookie_jar.clear()
-
-                if self.headers is not None and "cookie" in self.headers:
-                    del self.headers["cookie"]
+            self._last_token_cookie = None
+            self._token_cookie_header = None
+            self._token_valid_until = 0.0
 
             auth = {
                 "username": self._username,
@@ -438,17 +689,14 @@ class BaseApiClient:
                 "remember": True,
             }
 
+            # `request` already picks up the TOKEN cookie from the parsed response
+            # cookies and sends it back (from the session cookie jar or explicitly if
+            # the jar does not store it), so only the CSRF token is kept as a header
             response = await self.request("post", url=url, json=auth)
-            self.headers = {
-                "cookie": response.headers.get("set-cookie", ""),
-            }
-
             csrf_token = response.headers.get("x-csrf-token")
-            if csrf_token is not None:
-                self.headers["x-csrf-token"] = csrf_token
+            self.headers = {} if csrf_token is None else {"x-csrf-token": csrf_token}
 
             self._is_authenticated = True
-            self._update_last_token_cookie(response)
             _LOGGER.debug("Authenticated successfully!")
 
     def _update_last_token_cookie(self, response: aiohttp.ClientResponse) -> None:
@@ -457,38 +705,30 @@ class BaseApiClient:
             token_cookie := response.cookies.get("TOKEN")
         ) and token_cookie != self._last_token_cookie:
             self._last_token_cookie = token_cookie
-            self._last_token_cookie_decode = None
+            self._last_token_cookie_decode = decode_token_cookie(token_cookie)
+            self._token_cookie_header = None
+            self._token_valid_until = 0.0
+
+            if (
+                self._last_token_cookie_decode is not None
+                and "exp" in self._last_token_cookie_decode
+            ):
+                # convert expire time to the monotonic clock once so checking
+                # the token is a single compare
+                self._token_valid_until = (
+                    float(self._last_token_cookie_decode["exp"])
+                    - TOKEN_COOKIE_MAX_EXP_SECONDS
+                    - time.time()
+                    + time.monotonic()
+                )
 
     def is_authenticated(self) -> bool:
         """Check to see if we are already authenticated."""
-        if self._session is None:
-            return False
-
-        if self._is_authenticated is False:
-            return False
-
-        if self._last_token_cookie is None:
-            return False
-
-        # Lazy decode the token cookie
-        if self._last_token_cookie and self._last_token_cookie_decode is None:
-            self._last_token_cookie_decode = decode_token_cookie(
-                self._last_token_cookie,
-            )
-
-        if (
-            self._last_token_cookie_decode is None
-            or "exp" not in self._last_token_cookie_decode
-        ):
-            return False
-
-        token_expires_at = self._last_token_cookie_decode["exp"]
-        max_expire_time = time.time() + TOKEN_COOKIE_MAX_EXP_SECONDS
-
-        if token_expires_at < max_expire_time:
-            return False
-
-        return True
+        return (
+            self._session is not None
+            and self._is_authenticated
+            and time.monotonic() < self._token_valid_until
+        )
 
     async def async_connect_ws(self, force: bool) -> None:
         """Connect to Websocket."""
@@ -499,7 +739,7 @@ class BaseApiClient:
 
         websocket = await self.get_websocket()
         # important to make sure WS URL is always current
-        websocket.url = self.ws_url
+        websocket.url = self._ws_pushed_url = self.ws_url
 
         if not websocket.is_connected:
             self._last_ws_status = False
@@ -540,6 +780,9 @@ class BaseApiClient:
     def _get_last_update_id(self) -> Optional[UUID]:
         raise NotImplementedError
 
+    def _get_last_update_id_str(self) -> Optional[str]:
+        raise NotImplementedError
+
 
 class ProtectApiClient(BaseApiClient):
     """Main UFP API Client
@@ -574,10 +817,11 @@ class ProtectApiClient(BaseApiClient):
     _minimum_score: int
     _subscribed_models: set[ModelType]
     _ignore_stats: bool
-    _ws_subscriptions: list[Callable[[WSSubscriptionMessage], None]]
+    _ws_subscriptions: dict[object, Callable[[WSSubscriptionMessage], None]]
     _bootstrap: Optional[Bootstrap] = None
     _last_update_dt: Optional[datetime] = None
     _connection_host: Optional[Union[IPv4Address, IPv6Address, str]] = None
+    _inflight_requests: dict[str, _InflightRequest]
 
     cache_dir: Path
     ignore_unadopted: bool
@@ -612,9 +856,10 @@ class ProtectApiClient(BaseApiClient):
         self._minimum_score = minimum_score
         self._subscribed_models = subscribed_models or set()
         self._ignore_stats = ignore_stats
-        self._ws_subscriptions = []
+        self._ws_subscriptions = {}
         self.ignore_unadopted = ignore_unadopted
         self.cache_dir = cache_dir or Path(gettempdir()) / "ufp_cache"
+        self._inflight_requests = {}
 
         if override_connection_host:
             self._connection_host = ip_from_host(self._host)
@@ -688,32 +933,33 @@ class ProtectApiClient(BaseApiClient):
             start=self._last_update_dt or max_event_dt,
             end=now_dt,
         )
-        for event in events:
-            self.bootstrap.process_event(event)
+        self.bootstrap.process_events(events)
 
         self._last_update = now
         self._last_update_dt = now_dt
         return self._bootstrap
 
     def emit_message(self, msg: WSSubscriptionMessage) -> None:
-        if msg.new_obj is not None:
-            _LOGGER.debug(
-                "emitting message: %s:%s:%s:%s",
-                msg.action,
-                msg.new_obj.model,
-                msg.new_obj.id,
-                list(msg.changed_data.keys()),
-            )
-        elif msg.old_obj is not None:
-            _LOGGER.debug(
-                "emitting message: %s:%s:%s",
-                msg.action,
-                msg.old_obj.model,
-                msg.old_obj.id,
-            )
-        else:
-            _LOGGER.debug("emitting message: %s", msg.action)
-        for sub in self._ws_subscriptions:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            if msg.new_obj is not None:
+                _LOGGER.debug(
+                    "emitting message: %s:%s:%s:%s",
+                    msg.action,
+                    msg.new_obj.model,
+                    msg.new_obj.id,
+                    list(msg.changed_data.keys()),
+                )
+            elif msg.old_obj is not None:
+                _LOGGER.debug(
+                    "emitting message: %s:%s:%s",
+                    msg.action,
+                    msg.old_obj.model,
+                    msg.old_obj.id,
+                )
+            else:
+                _LOGGER.debug("emitting message: %s", msg.action)
+        # copy so handlers can unsubscribe while the message is dispatched
+        for sub in tuple(self._ws_subscriptions.values()):
             try:
                 sub(msg)
             except Exception:
@@ -724,6 +970,11 @@ class ProtectApiClient(BaseApiClient):
             return None
         return self._bootstrap.last_update_id
 
+    def _get_last_update_id_str(self) -> Optional[str]:
+        if self._bootstrap is None:
+            return None
+        return self._bootstrap.last_update_id_str
+
     def _process_ws_message(self, msg: aiohttp.WSMessage) -> None:
         packet = WSPacket(msg.data)
         processed_message = self.bootstrap.process_ws_packet(
@@ -731,9 +982,14 @@ class ProtectApiClient(BaseApiClient):
             models=self._subscribed_models,
             ignore_stats=self._ignore_stats,
         )
-        # update websocket URL after every message to ensure the latest last_update_id
-        if self._websocket is not None:
-            self._websocket.url = self.ws_url
+        # update websocket URL when it changes (new last_update_id) to ensure it is
+        # current if the websocket reconnects, `ws_url` returns the same cached str
+        # until then
+        if (
+            self._websocket is not None
+            and (ws_url := self.ws_url) is not self._ws_pushed_url
+        ):
+            self._websocket.url = self._ws_pushed_url = ws_url
 
         if processed_message is None:
             return
@@ -750,52 +1006,65 @@ class ProtectApiClient(BaseApiClient):
         start_int = to_js_time(start)
         end_int = to_js_time(end) if end else None
         offset = 0
-        current_start = sys.maxsize
         events: list[dict[str, Any]] = []
         request_count = 0
+        batch_size = 1
         logged = False
+        done = False
 
-        params["limit"] = 100
+        params["limit"] = EVENT_PAGE_SIZE
         # greedy algorithm
         # always force desc to receive faster results in the vast majority of cases
         params["orderDirection"] = "DESC"
 
-        _LOGGER.debug("paginate desc %s %s", start_int, end_int)
-        while current_start > start_int:
-            params["offset"] = offset
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("paginate desc %s %s", start_int, end_int)
+        while not done:
+            # offset pagination is stateless, so pages can be fetched ahead of time.
+            # start with a single page and widen the window every time the batch
+            # did not reach `start`
+            offsets = [offset + i * EVENT_PAGE_SIZE for i in range(batch_size)]
+            if debug:
+                _LOGGER.debug("page desc %s", offsets)
+            pages = await asyncio.gather(
+                *(
+                    self.api_request_list("events", params={**params, "offset": o})
+                    for o in offsets
+                ),
+            )
+            request_count += len(pages)
+            offset += len(pages) * EVENT_PAGE_SIZE
+            batch_size = min(batch_size * 2, EVENT_PAGE_MAX_BATCH)
+
+            for new_events in pages:
+                if not new_events:
+                    done = True
+                    break
+
+                # pages are sorted DESC, so only keep the events between `end`
+                # and `start`; anything after this page is older than `start`
+                starts = [-e["start"] for e in new_events]
+                first = 0
+                if end_int is not None:
+                    if debug:
+                        _LOGGER.debug(
+                            "page end %s (%s)",
+                            new_events[0]["end"],
+                            end_int,
+                        )
+                    first = bisect_left(starts, -end_int)
+                events += new_events[first : bisect_right(starts, -start_int)]
 
-            _LOGGER.debug("page desc %s %s", offset, current_start)
-            new_events = await self.api_request_list("events", params=params)
-            request_count += 1
-            if not new_events:
-                break
-
-            if end_int is not None:
-                _LOGGER.debug("page end %s (%s)", new_events[0]["end"], end_int)
-                for event in new_events:
-                    if event["start"] <= end_int:
-                        events.append(event)
-                    else:
-                        break
-            else:
-                events += new_events
+                # any pages after this one were fetched ahead and are not needed
+                if new_events[-1]["start"] <= start_int:
+                    done = True
+                    break
 
-            offset += 100
-            if events:
-                current_start = events[-1]["start"]
             if not logged and request_count > 5:
                 logged = True
                 _LOGGER.warning(TYPES_BUG_MESSAGE)
 
-        to_remove = 0
-        for event in reversed(events):
-            if event["start"] < start_int:
-                to_remove += 1
-            else:
-                break
-        if to_remove:
-            events = events[:-to_remove]
-
         return events
 
     async def get_events_raw(
@@ -856,10 +1125,10 @@ class ProtectApiClient(BaseApiClient):
             params["end"] = to_js_time(end)
 
         if types is not None:
-            params["types"] = [e.value for e in types]
+            params["types"] = list(_enum_values(tuple(types)))
 
         if smart_detect_types is not None:
-            params["smartDetectTypes"] = [e.value for e in smart_detect_types]
+            params["smartDetectTypes"] = list(_enum_values(tuple(smart_detect_types)))
 
         if all_cameras is not None:
             params["allCameras"] = str(all_cameras).lower()
@@ -919,7 +1188,7 @@ class ProtectApiClient(BaseApiClient):
             end: end time for events
             limit: max number of events to return
             offset: offset to start fetching events from
-            types: list of EventTypes to get events for
+            types: list of EventTypes to get events for, defaults to device events
             smart_detect_types: Filters the Smart detection types for the events
             sorting: sort events by ascending or decending, defaults to ascending (chronologic order)
             description: included additional event metadata
@@ -932,6 +1201,10 @@ class ProtectApiClient(BaseApiClient):
         `limit` must be provided. Otherwise, you will get a 400 error from UniFi Protect
         """
 
+        if types is None:
+            # only device events are returned, so let UniFi Protect filter them
+            types = [EventType(t) for t in EventType.device_events()]
+
         response = await self.get_events_raw(
             start=start,
             end=end,
@@ -944,25 +1217,26 @@ class ProtectApiClient(BaseApiClient):
             category=category,
             _allow_manual_paginate=_allow_manual_paginate,
         )
-        events = []
+        events: list[Event] = []
+        append = events.append
+        event_types = EventType.values_set()
+        device_events = EventType.device_events_set()
+        minimum_score = self._minimum_score
+        from_unifi_dict = Event.from_unifi_dict
 
         for event_dict in response:
             # ignore unknown events
-            if "type" not in event_dict or event_dict["type"] not in EventType.values():
+            if event_dict.get("type") not in event_types:
                 _LOGGER.debug("Unknown event type: %s", event_dict)
                 continue
 
-            event = create_from_unifi_dict(event_dict, api=self)
-
             # should never happen
-            if not isinstance(event, Event):
+            if event_dict.get("modelKey") != ModelType.EVENT.value:
                 continue
 
-            if (
-                event.type.value in EventType.device_events()
-                and event.score >= self._minimum_score
-            ):
-                events.append(event)
+            event = from_unifi_dict(**event_dict, api=self)
+            if event.type.value in device_events and event.score >= minimum_score:
+                append(event)
 
         return events
 
@@ -975,11 +1249,13 @@ class ProtectApiClient(BaseApiClient):
         Returns a callback that will unsubscribe.
         """
 
+        key = object()
+
         def _unsub_ws_callback() -> None:
-            self._ws_subscriptions.remove(ws_callback)
+            self._ws_subscriptions.pop(key, None)
 
         _LOGGER.debug("Adding subscription: %s", ws_callback)
-        self._ws_subscriptions.append(ws_callback)
+        self._ws_subscriptions[key] = ws_callback
         return _unsub_ws_callback
 
     async def get_bootstrap(self) -> Bootstrap:
@@ -991,26 +1267,74 @@ class ProtectApiClient(BaseApiClient):
         data = await self.api_request_obj("bootstrap")
         # fix for UniFi Protect bug, some cameras may come back with and old recording mode
         # "motion" and "smartDetect" recording modes was combined into "detections" in Protect 1.20.0
-        call_again = False
+        # the fix is applied locally in the same pass instead of downloading the bootstrap again
+        stale_ids: list[str] = []
         for camera_dict in data["cameras"]:
-            if camera_dict.get("recordingSettings", {}).get("mode", "detections") in {
-                "motion",
-                "smartDetect",
-            }:
-                await self.update_device(
-                    ModelType.CAMERA,
-                    camera_dict["id"],
-                    {"recordingSettings": {"mode": RecordingMode.DETECTIONS.value}},
-                )
-                call_again = True
+            recording_settings = camera_dict.get("recordingSettings")
+            if (
+                recording_settings is not None
+                and recording_settings.get("mode") in _STALE_RECORDING_MODES
+            ):
+                recording_settings["mode"] = RecordingMode.DETECTIONS.value
+                stale_ids.append(camera_dict["id"])
+
+        if stale_ids:
+            await asyncio.gather(
+                *(
+                    self.update_device(
+                        ModelType.CAMERA,
+                        camera_id,
+                        {"recordingSettings": {"mode": RecordingMode.DETECTIONS.value}},
+                    )
+                    for camera_id in stale_ids
+                ),
+            )
 
-        if call_again:
-            data = await self.api_request_obj("bootstrap")
         return Bootstrap.from_unifi_dict(**data, api=self)
 
+    async def _shared_request(
+        self,
+        url: str,
+        request: Callable[[], Coroutine[Any, Any, Any]],
+    ) -> Any:
+        """Runs `request`, concurrent calls for the same `url` share one request.
+
+        Every caller except the last one to get the result receives a copy so the
+        results can be safely modified.
+        """
+
+        inflight = self._inflight_requests.get(url)
+        if inflight is None:
+            inflight = _InflightRequest(asyncio.create_task(request()))
+            self._inflight_requests[url] = inflight
+
+            def _done(task: asyncio.Task[Any]) -> None:
+                if self._inflight_requests.get(url) is inflight:
+                    del self._inflight_requests[url]
+                # mark exception as retrieved in case every caller was cancelled
+                if not task.cancelled():
+                    task.exception()
+
+            inflight.task.add_done_callback(_done)
+
+        inflight.waiters += 1
+        try:
+            result = await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+
+        if inflight.waiters or inflight.claimed:
+            return deepcopy(result)
+        inflight.claimed = True
+        return result
+
     async def get_devices_raw(self, model_type: ModelType) -> list[dict[str, Any]]:
         """Gets a raw device list given a model_type"""
-        return await self.api_request_list(f"{model_type.value}s")
+        url = f"{model_type.value}s"
+        return cast(
+            list[dict[str, Any]],
+            await self._shared_request(url, lambda: self.api_request_list(url)),
+        )
 
     async def get_devices(
         self,
@@ -1020,13 +1344,19 @@ class ProtectApiClient(BaseApiClient):
         """Gets a device list given a model_type, converted into Python objects"""
         objs: list[ProtectModel] = []
 
+        # the model class is fixed by model_type, so only check adoption if it can be adopted
+        klass = MODEL_TO_CLASS.get(model_type)
+        check_adopted = self.ignore_unadopted and (
+            klass is None or issubclass(klass, ProtectAdoptableDeviceModel)
+        )
+
         for obj_dict in await self.get_devices_raw(model_type):
             obj = create_from_unifi_dict(obj_dict)
 
             if expected_type is not None and not isinstance(obj, expected_type):
                 raise NvrError(f"Unexpected model returned: {obj.model}")
             if (
-                self.ignore_unadopted
+                check_adopted
                 and isinstance(obj, ProtectAdoptableDeviceModel)
                 and not obj.is_adopted
             ):
@@ -1098,13 +1428,27 @@ class ProtectApiClient(BaseApiClient):
             await self.get_devices(ModelType.LIVEVIEW, Liveview),
         )
 
+    async def get_all_devices(self) -> dict[ModelType, list[ProtectModel]]:
+        """Gets the lists of all device types straight from the NVR concurrently.
+
+        The websocket is connected and running, you likely just want to use `self.bootstrap`
+        """
+        results = await asyncio.gather(
+            *(self.get_devices(model_type) for model_type in DEVICE_MODEL_TYPES),
+        )
+        return dict(zip(DEVICE_MODEL_TYPES, results))
+
     async def get_device_raw(
         self,
         model_type: ModelType,
         device_id: str,
     ) -> dict[str, Any]:
         """Gets a raw device give the device model_type and id"""
-        return await self.api_request_obj(f"{model_type.value}s/{device_id}")
+        url = f"{model_type.value}s/{device_id}"
+        return cast(
+            dict[str, Any],
+            await self._shared_request(url, lambda: self.api_request_obj(url)),
+        )
 
     async def get_device(
         self,
@@ -1222,21 +1566,8 @@ class ProtectApiClient(BaseApiClient):
         Datetime of screenshot is approximate. It may be +/- a few seconds.
         """
 
-        params = {
-            "ts": to_js_time(dt or utc_now()),
-            "force": "true",
-        }
-
-        if width is not None:
-            params.update({"w": width})
-
-        if height is not None:
-            params.update({"h": height})
-
-        path = "snapshot"
-        if dt is not None:
-            path = "recording-snapshot"
-            del params["force"]
+        params = _snapshot_params(width, height, dt)
+        path = "snapshot" if dt is None else "recording-snapshot"
 
         return await self.api_request_raw(
             f"cameras/{camera_id}/{path}",
@@ -1256,22 +1587,11 @@ class ProtectApiClient(BaseApiClient):
         Datetime of screenshot is approximate. It may be +/- a few seconds.
         """
 
-        params = {
-            "ts": to_js_time(dt or utc_now()),
-            "force": "true",
-        }
-
-        if width is not None:
-            params.update({"w": width})
-
-        if height is not None:
-            params.update({"h": height})
-
+        params = _snapshot_params(width, height, dt)
         path = "package-snapshot"
         if dt is not None:
             path = "recording-snapshot"
-            del params["force"]
-            params.update({"lens": 2})
+            params["lens"] = 2
 
         return await self.api_request_raw(
             f"cameras/{camera_id}/{path}",
@@ -1285,17 +1605,20 @@ class ProtectApiClient(BaseApiClient):
         chunk_size: int,
         iterator_callback: Optional[IteratorCallback] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        output: Optional[AsyncBufferedIOBase] = None,
     ) -> None:
         total = response.content_length or 0
         current = 0
         if iterator_callback is not None:
             await iterator_callback(total, None)
         async for chunk in response.content.iter_chunked(chunk_size):
-            step = len(chunk)
-            current += step
+            if output is not None:
+                await output.write(chunk)
             if iterator_callback is not None:
                 await iterator_callback(total, chunk)
             if progress_callback is not None:
+                step = len(chunk)
+                current += step
                 await progress_callback(step, current, total)
 
     async def get_camera_video(
@@ -1342,9 +1665,9 @@ class ProtectApiClient(BaseApiClient):
             params["type"] = "timelapse"
 
         if channel_index == 3:
-            params.update({"lens": 2})
+            params["lens"] = 2
         else:
-            params.update({"channel": channel_index})
+            params["channel"] = channel_index
 
         path = "video/export"
         if (
@@ -1360,21 +1683,20 @@ class ProtectApiClient(BaseApiClient):
 
         r = await self.request(
             "get",
-            urljoin(self.api_path, path),
+            self._api_base / path,
             auto_close=False,
             timeout=0,
             params=params,
         )
         if output_file is not None:
             async with aiofiles.open(output_file, "wb") as output:
-
-                async def callback(total: int, chunk: bytes | None) -> None:
-                    if iterator_callback is not None:
-                        await iterator_callback(total, chunk)
-                    if chunk is not None:
-                        await output.write(chunk)
-
-                await self._stream_response(r, chunk_size, callback, progress_callback)
+                await self._stream_response(
+                    r,
+                    chunk_size,
+                    iterator_callback,
+                    progress_callback,
+                    output,
+                )
         else:
             await self._stream_response(
                 r,
@@ -1399,15 +1721,37 @@ class ProtectApiClient(BaseApiClient):
 
         now = time.monotonic()
         timeout = now + retry_timeout
-        data: Optional[bytes] = None
+        delay = RETRY_DELAY_MIN
+        data: Optional[Union[bytes, bytearray]] = None
         while data is None and now < timeout:
             data = await self.api_request_raw(path, raise_exception=False, **kwargs)
             if data is None:
-                await asyncio.sleep(0.5)
+                # jitter keeps concurrent retries from hitting the NVR in lockstep
+                await asyncio.sleep(
+                    min(delay * random.uniform(0.8, 1.2), max(timeout - now, 0)),
+                )
+                delay = min(delay * RETRY_DELAY_FACTOR, RETRY_DELAY_MAX)
                 now = time.monotonic()
 
         return data
 
+    async def _get_event_image(
+        self,
+        event_id: str,
+        kind: Literal["thumbnail", "animated-thumbnail", "heatmap"],
+        retry_timeout: int = RETRY_TIMEOUT,
+        **kwargs: Any,
+    ) -> Optional[bytes]:
+        """Gets a generated image (thumbnail, animated thumbnail or heatmap) for an event."""
+
+        # old thumbnail / heatmap URLs use an image ID, which is just `e-{event_id}`
+        event_id = event_id.replace("e-", "")
+        return await self._get_image_with_retry(
+            f"events/{event_id}/{kind}",
+            retry_timeout=retry_timeout,
+            **kwargs,
+        )
+
     async def get_event_thumbnail(
         self,
         thumbnail_id: str,
@@ -1426,17 +1770,16 @@ class ProtectApiClient(BaseApiClient):
         params: dict[str, Any] = {}
 
         if width is not None:
-            params.update({"w": width})
+            params["w"] = width
 
         if height is not None:
-            params.update({"h": height})
+            params["h"] = height
 
-        # old thumbnail URL use thumbnail ID, which is just `e-{event_id}`
-        thumbnail_id = thumbnail_id.replace("e-", "")
-        return await self._get_image_with_retry(
-            f"events/{thumbnail_id}/thumbnail",
+        return await self._get_event_image(
+            thumbnail_id,
+            "thumbnail",
+            retry_timeout,
             params=params,
-            retry_timeout=retry_timeout,
         )
 
     async def get_event_animated_thumbnail(
@@ -1462,17 +1805,16 @@ class ProtectApiClient(BaseApiClient):
         }
 
         if width is not None:
-            params.update({"w": width})
+            params["w"] = width
 
         if height is not None:
-            params.update({"h": height})
+            params["h"] = height
 
-        # old thumbnail URL use thumbnail ID, which is just `e-{event_id}`
-        thumbnail_id = thumbnail_id.replace("e-", "")
-        return await self._get_image_with_retry(
-            f"events/{thumbnail_id}/animated-thumbnail",
+        return await self._get_event_image(
+            thumbnail_id,
+            "animated-thumbnail",
+            retry_timeout,
             params=params,
-            retry_timeout=retry_timeout,
         )
 
     async def get_event_heatmap(
@@ -1488,12 +1830,7 @@ class ProtectApiClient(BaseApiClient):
         your retry timeout will always return None.
         """
 
-        # old heatmap URL use heatmap ID, which is just `e-{event_id}`
-        heatmap_id = heatmap_id.replace("e-", "")
-        return await self._get_image_with_retry(
-            f"events/{heatmap_id}/heatmap",
-            retry_timeout=retry_timeout,
-        )
+        return await self._get_event_image(heatmap_id, "heatmap", retry_timeout)
 
     async def get_event_smart_detect_track_raw(self, event_id: str) -> dict[str, Any]:
         """Gets raw Smart Detect Track for a Smart Detection"""
@@ -1521,12 +1858,54 @@ class ProtectApiClient(BaseApiClient):
         Tested updates have been added a methods on applicable devices.
         """
 
+        batches = _UPDATE_BATCHES.get()
+        if batches is not None and (batch := batches.get(self)) is not None:
+            dict_merge(batch.setdefault((model_type, device_id), {}), data)
+            return
+
         await self.api_request(
             f"{model_type.value}s/{device_id}",
             method="patch",
             json=data,
         )
 
+    @contextlib.asynccontextmanager
+    async def batch_updates(self) -> AsyncIterator[None]:
+        """Combines device updates into a single PATCH per device.
+
+        All `update_device` calls (including ones from `.save_device()` / `.set_` methods
+        on devices) inside of the context are buffered and then sent concurrently on exit.
+        Since nothing is sent until the context exits, failures will not revert the changes
+        on the device objects. Nothing is sent if the context exits with an exception.
+
+        Only updates made from the current task (and tasks created inside of the context)
+        are buffered, other tasks using the same client keep sending updates immediately.
+        """
+
+        batches = _UPDATE_BATCHES.get() or {}
+        if self in batches:
+            # already batching, the outer context will send the updates
+            yield
+            return
+
+        batch: dict[tuple[ModelType, str], dict[str, Any]] = {}
+        token = _UPDATE_BATCHES.set({**batches, self: batch})
+        try:
+            yield
+        finally:
+            _UPDATE_BATCHES.reset(token)
+
+        await asyncio.gather(
+            *(
+                self.api_request(
+                    f"{model_type.value}s/{device_id}",
+                    method="patch",
+                    json=data,
+                )
+                for (model_type, device_id), data in batch.items()
+            ),
+        )
+
     async def update_nvr(self, data: dict[str, Any]) -> None:
         """Sends an update for main UFP NVR device
 
@@ -1609,19 +1988,27 @@ class ProtectApiClient(BaseApiClient):
         package: str = "unifi-protect",
     ) -> set[Version]:
         session = await self.get_session()
+        pattern = _package_version_re(package)
+        decoder = codecs.getincrementaldecoder("utf-8")()
         versions: set[Version] = set()
+        text = ""
 
         try:
             async with session.get(url) as response:
-                is_package = False
-                for line in (await response.text()).split("\n"):
-                    if line.startswith("Package: "):
-                        is_package = False
-                        if line == f"Package: {package}":
-                            is_package = True
-
-                    if is_package and line.startswith("Version: "):
-                        versions.add(Version(line.split(": ")[-1]))
+                async for chunk in response.content.iter_chunked(
+                    STREAM_READ_CHUNK_SIZE,
+                ):
+                    text += decoder.decode(chunk)
+                    # only scan complete package entries, keep the rest for the next chunk
+                    end = text.rfind("\n\n")
+                    if end == -1:
+                        continue
+                    versions.update(
+                        Version(match.group(1))
+                        for match in pattern.finditer(text, 0, end + 1)
+                    )
+                    text = text[end + 2 :]
+                text += decoder.decode(b"", final=True)
         except (
             TimeoutError,
             asyncio.TimeoutError,
@@ -1631,6 +2018,7 @@ class ProtectApiClient(BaseApiClient):
         ) as err:
             raise NvrError(f"Error packages from {url}: {err}") from err
 
+        versions.update(Version(match.group(1)) for match in pattern.finditer(text))
         return versions
 
     async def get_release_versions(self) -> set[Version]:
@@ -28,21 +28,23 @@ from pyunifiprotect.utils import (
     convert_unifi_data,
     dict_diff,
     is_debug,
-    process_datetime,
     serialize_unifi_obj,
     to_snake_case,
 )
 
 try:
     from pydantic.v1 import BaseModel
-    from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, PrivateAttr
+    from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, ModelField, PrivateAttr
+    from pydantic.v1.utils import IMMUTABLE_NON_COLLECTIONS_TYPES
 except ImportError:
     from pydantic import BaseModel  # type: ignore[assignment]
     from pydantic.fields import (  # type: ignore[attr-defined]
         SHAPE_DICT,
         SHAPE_LIST,
+        ModelField,
         PrivateAttr,
     )
+    from pydantic.utils import IMMUTABLE_NON_COLLECTIONS_TYPES
 
 if TYPE_CHECKING:
     from asyncio.events import TimerHandle
@@ -50,9 +52,9 @@ if TYPE_CHECKING:
     from typing_extensions import Self  # requires Python 3.11+
 
     try:
-        from pydantic.v1.typing import DictStrAny, SetStr
+        from pydantic.v1.typing import SetStr
     except ImportError:
-        from pydantic.typing import DictStrAny, SetStr
+        from pydantic.typing import SetStr
 
     from pyunifiprotect.api import ProtectApiClient
     from pyunifiprotect.data.devices import Bridge
@@ -63,6 +65,8 @@ if TYPE_CHECKING:
 ProtectObject = TypeVar("ProtectObject", bound="ProtectBaseObject")
 RECENT_EVENT_MAX = timedelta(seconds=30)
 EVENT_PING_INTERVAL = timedelta(seconds=3)
+# default for fields without one in `ProtectBaseObject._construct_fields`
+_REQUIRED = object()
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -82,13 +86,28 @@ class ProtectBaseObject(BaseModel):
     _protect_lists_set: ClassVar[Optional[SetStr]] = None
     _protect_dicts: ClassVar[Optional[dict[str, type[ProtectBaseObject]]]] = None
     _protect_dicts_set: ClassVar[Optional[SetStr]] = None
-    _to_unifi_remaps: ClassVar[Optional[DictStrAny]] = None
+    _unifi_remaps: ClassVar[dict[str, str]] = {}
+    _to_unifi_remaps: ClassVar[dict[str, str]] = {}
+    # (name, alias, field if its default needs copying, shared default) per field
+    _construct_fields: ClassVar[
+        tuple[tuple[str, Optional[str], Optional[ModelField], Any], ...]
+    ] = ()
 
     class Config:
         arbitrary_types_allowed = True
         validate_assignment = True
         copy_on_model_validation = "shallow"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # remaps are fixed per class, so resolve them once when the class is created
+        cls._unifi_remaps = cls._get_unifi_remaps()
+        cls._to_unifi_remaps = {
+            to_key: from_key for from_key, to_key in cls._unifi_remaps.items()
+        }
+        cls._construct_fields = cls._get_construct_fields()
+
     def __init__(self, api: Optional[ProtectApiClient] = None, **data: Any) -> None:
         """Base class for creating Python objects from UFP JSON data.
 
@@ -128,34 +147,69 @@ class ProtectBaseObject(BaseModel):
     @classmethod
     def construct(cls, _fields_set: Optional[set[str]] = None, **values: Any) -> Self:
         api = values.pop("api", None)
-        values_set = set(values)
 
-        unifi_objs = cls._get_protect_objs()
-        for key in cls._get_protect_objs_set().intersection(values_set):
-            if isinstance(values[key], dict):
-                values[key] = unifi_objs[key].construct(**values[key])
+        for key, klass in cls._get_protect_objs().items():
+            if isinstance(value := values.get(key), dict):
+                values[key] = klass.construct(**value)
 
-        unifi_lists = cls._get_protect_lists()
-        for key in cls._get_protect_lists_set().intersection(values_set):
-            if isinstance(values[key], list):
+        for key, klass in cls._get_protect_lists().items():
+            if isinstance(value := values.get(key), list):
                 values[key] = [
-                    unifi_lists[key].construct(**v) if isinstance(v, dict) else v
-                    for v in values[key]
+                    klass.construct(**v) if isinstance(v, dict) else v for v in value
                 ]
 
-        unifi_dicts = cls._get_protect_dicts()
-        for key in cls._get_protect_dicts_set().intersection(values_set):
-            if isinstance(values[key], dict):
+        for key, klass in cls._get_protect_dicts().items():
+            if isinstance(value := values.get(key), dict):
                 values[key] = {
-                    k: unifi_dicts[key].construct(**v) if isinstance(v, dict) else v
-                    for k, v in values[key].items()
+                    k: klass.construct(**v) if isinstance(v, dict) else v
+                    for k, v in value.items()
                 }
 
-        obj = super().construct(_fields_set=_fields_set, **values)
+        # same as `BaseModel.construct`, but immutable defaults are shared instead of
+        # going through `field.get_default()` for every missing field
+        fields_values: dict[str, Any] = {}
+        for name, alias, copied_field, default in cls._construct_fields:
+            if alias is not None and alias in values:
+                fields_values[name] = values[alias]
+            elif name in values:
+                fields_values[name] = values[name]
+            elif copied_field is not None:
+                fields_values[name] = copied_field.get_default()
+            elif default is not _REQUIRED:
+                fields_values[name] = default
+        fields_values.update(values)
+
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "__dict__", fields_values)
+        object.__setattr__(
+            obj,
+            "__fields_set__",
+            set(values) if _fields_set is None else _fields_set,
+        )
+        obj._init_private_attributes()
         obj._api = api
 
         return obj
 
+    @classmethod
+    def _get_construct_fields(
+        cls,
+    ) -> tuple[tuple[str, Optional[str], Optional[ModelField], Any], ...]:
+        """Fields in declaration order for `construct`, with immutable defaults split from ones that need to be copied per object."""
+        construct_fields = []
+        for name, field in cls.__fields__.items():
+            alias = field.alias if field.alt_alias else None
+            if field.required:
+                construct_fields.append((name, alias, None, _REQUIRED))
+            elif (
+                field.default_factory is None
+                and field.default.__class__ in IMMUTABLE_NON_COLLECTIONS_TYPES
+            ):
+                construct_fields.append((name, alias, None, field.default))
+            else:
+                construct_fields.append((name, alias, field, None))
+        return tuple(construct_fields)
+
     @classmethod
     @cache
     def _get_excluded_changed_fields(cls) -> set[str]:
@@ -190,11 +244,6 @@ class ProtectBaseObject(BaseModel):
         }
         """
 
-        if cls._to_unifi_remaps is None:
-            cls._to_unifi_remaps = {
-                to_key: from_key for from_key, to_key in cls._get_unifi_remaps().items()
-            }
-
         return cls._to_unifi_remaps
 
     @classmethod
@@ -328,49 +377,32 @@ class ProtectBaseObject(BaseModel):
         # get the API client instance
         api = cls._get_api(data.get("api"))
 
-        # remap keys that will not be converted correctly by snake_case convert
-        remaps = cls._get_unifi_remaps()
-        for from_key in set(remaps).intersection(data):
-            data[remaps[from_key]] = data.pop(from_key)
-
-        # convert to snake_case and remove extra fields
-        for key in list(data.keys()):
-            new_key = to_snake_case(key)
-            data[new_key] = data.pop(key)
-            key = new_key  # noqa: PLW2901
+        # remap keys that will not be converted correctly by snake_case convert,
+        # convert to snake_case and remove extra fields in a single pass
+        remaps = cls._unifi_remaps
+        fields = cls.__fields__
+        converted: dict[str, Any] = {}
+        for key, value in data.items():
+            key = to_snake_case(remaps.get(key, key))  # noqa: PLW2901
 
             if key == "api":
-                continue
-
-            if key not in cls.__fields__:
-                del data[key]
-                continue
-            data[key] = convert_unifi_data(data[key], cls.__fields__[key])
+                converted[key] = value
+            elif (field := fields.get(key)) is not None:
+                converted[key] = convert_unifi_data(value, field)
+        data = converted
 
         # clean child UFP objs
-        data_set = set(data)
+        for key, klass in cls._get_protect_objs().items():
+            if key in data:
+                data[key] = cls._clean_protect_obj(data[key], klass, api)
 
-        unifi_objs = cls._get_protect_objs()
-        for key in cls._get_protect_objs_set().intersection(data_set):
-            data[key] = cls._clean_protect_obj(data[key], unifi_objs[key], api)
-
-        unifi_lists = cls._get_protect_lists()
-        for key in cls._get_protect_lists_set().intersection(data_set):
-            if isinstance(data[key], list):
-                data[key] = cls._clean_protect_obj_list(
-                    data[key],
-                    unifi_lists[key],
-                    api,
-                )
+        for key, klass in cls._get_protect_lists().items():
+            if isinstance(value := data.get(key), list):
+                data[key] = cls._clean_protect_obj_list(value, klass, api)
 
-        unifi_dicts = cls._get_protect_dicts()
-        for key in cls._get_protect_dicts_set().intersection(data_set):
-            if isinstance(data[key], dict):
-                data[key] = cls._clean_protect_obj_dict(
-                    data[key],
-                    unifi_dicts[key],
-                    api,
-                )
+        for key, klass in cls._get_protect_dicts().items():
+            if isinstance(value := data.get(key), dict):
+                data[key] = cls._clean_protect_obj_dict(value, klass, api)
 
         return data
 
@@ -476,9 +508,10 @@ class ProtectBaseObject(BaseModel):
                 data[key] = self._unifi_dict_protect_obj_dict(data, key, use_obj)
 
         data: dict[str, Any] = serialize_unifi_obj(data)
-        remaps = self._get_to_unifi_remaps()
-        for to_key in set(data).intersection(remaps):
-            data[remaps[to_key]] = data.pop(to_key)
+        remaps = self._to_unifi_remaps
+        for to_key, from_key in remaps.items():
+            if to_key in data:
+                data[from_key] = data.pop(to_key)
 
         if "api" in data:
             del data["api"]
@@ -516,6 +549,10 @@ class ProtectBaseObject(BaseModel):
 
     def update_from_dict(self: ProtectObject, data: dict[str, Any]) -> ProtectObject:
         """Updates current object from a cleaned UFP JSON dict"""
+        # like `from_unifi_dict`, UFP data is only validated in debug mode
+        validate = is_debug()
+        set_value = setattr if validate else self._set_value_no_validate
+
         data_set = set(data)
         for key in self._get_protect_objs_set().intersection(data_set):
             unifi_obj: Optional[Any] = getattr(self, key)
@@ -523,7 +560,7 @@ class ProtectBaseObject(BaseModel):
                 item = data.pop(key)
                 if item is not None:
                     item = unifi_obj.update_from_dict(item)
-                setattr(self, key, item)
+                set_value(self, key, item)
 
         data = self._inject_api(data, self._api)
         unifi_lists = self._get_protect_lists()
@@ -536,17 +573,37 @@ class ProtectBaseObject(BaseModel):
                 if item is not None and isinstance(item, ProtectBaseObject):
                     new_items.append(item)
                 elif isinstance(item, dict):
-                    new_items.append(klass(**item))
-            setattr(self, key, new_items)
+                    new_items.append(
+                        klass(**item) if validate else klass.construct(**item),
+                    )
+            set_value(self, key, new_items)
 
         # Always injected above
         del data["api"]
 
+        if not validate:
+            # remaining UFP objects have no current value to update, so build new ones
+            for key, klass in self._get_protect_objs().items():
+                if isinstance(value := data.get(key), dict):
+                    data[key] = klass.construct(**value)
+            for key, klass in self._get_protect_dicts().items():
+                if isinstance(value := data.get(key), dict):
+                    data[key] = {
+                        k: klass.construct(**v) if isinstance(v, dict) else v
+                        for k, v in value.items()
+                    }
+
         for key in data:
-            setattr(self, key, convert_unifi_data(data[key], self.__fields__[key]))
+            set_value(self, key, convert_unifi_data(data[key], self.__fields__[key]))
 
         return self
 
+    @staticmethod
+    def _set_value_no_validate(obj: ProtectBaseObject, key: str, value: Any) -> None:
+        """Sets a field value without running pydantic assignment validation."""
+        obj.__dict__[key] = value
+        obj.__fields_set__.add(key)
+
     def dict_with_excludes(self) -> dict[str, Any]:
         """Returns a dict of the current object without any UFP objects converted to dicts."""
         excludes = self.__class__._get_excluded_changed_fields()
@@ -598,6 +655,13 @@ class ProtectModelWithId(ProtectModel):
     _update_queue: asyncio.Queue[Callable[[], None]] = PrivateAttr(...)
     _update_event: asyncio.Event = PrivateAttr(...)
 
+    _read_only_fields: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._read_only_fields = frozenset(cls._get_read_only_fields())
+
     def __init__(self, **data: Any) -> None:
         update_lock = data.pop("update_lock", None)
         update_queue = data.pop("update_queue", None)
@@ -738,7 +802,7 @@ class ProtectModelWithId(ProtectModel):
         assert (
             self._update_lock.locked()
         ), "save_device_changes should only be called when the update lock is held"
-        read_only_fields = self.__class__._get_read_only_fields()
+        read_only_fields = self._read_only_fields
 
         if self.model is None:
             raise BadRequest("Unknown model type")
@@ -752,7 +816,7 @@ class ProtectModelWithId(ProtectModel):
         if updated == {}:
             return
 
-        read_only_keys = read_only_fields.intersection(updated.keys())
+        read_only_keys = updated.keys() & read_only_fields
         if len(read_only_keys) > 0:
             self.revert_changes(data_before_changes)
             raise BadRequest(
@@ -837,10 +901,6 @@ class ProtectDeviceModel(ProtectModelWithId):
 
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "lastSeen" in data:
-            data["lastSeen"] = process_datetime(data, "lastSeen")
-        if "upSince" in data and data["upSince"] is not None:
-            data["upSince"] = process_datetime(data, "upSince")
         if (
             "uptime" in data
             and data["uptime"] is not None
@@ -989,13 +1049,6 @@ class ProtectAdoptableDeviceModel(ProtectDeviceModel):
 
         return data
 
-    @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "lastDisconnect" in data and data["lastDisconnect"] is not None:
-            data["lastDisconnect"] = process_datetime(data, "lastDisconnect")
-
-        return super().unifi_dict_to_dict(data)
-
     @property
     def display_name(self) -> str:
         return self.name or self.market_name or self.type
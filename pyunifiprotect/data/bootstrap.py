@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
@@ -196,6 +197,7 @@ class Bootstrap(ProtectBaseObject):
     _has_media: Optional[bool] = PrivateAttr(None)
     _recording_start: Optional[datetime] = PrivateAttr(None)
     _refresh_tasks: set[asyncio.Task[None]] = PrivateAttr(set())
+    _last_update_id_str: Optional[tuple[UUID, str]] = PrivateAttr(None)
 
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
@@ -246,6 +248,15 @@ class Bootstrap(ProtectBaseObject):
 
         return data
 
+    @property
+    def last_update_id_str(self) -> str:
+        """String form of `last_update_id`, cached until it changes."""
+        cached = self._last_update_id_str
+        if cached is None or cached[0] is not self.last_update_id:
+            cached = (self.last_update_id, str(self.last_update_id))
+            self._last_update_id_str = cached
+        return cached[1]
+
     @property
     def ws_stats(self) -> list[WSStat]:
         return self._ws_stats
@@ -324,7 +335,7 @@ class Bootstrap(ProtectBaseObject):
         devices = getattr(self, f"{ref.model.value}s")
         return cast(ProtectAdoptableDeviceModel, devices.get(ref.id))
 
-    def process_event(self, event: Event) -> None:
+    def _process_event_device(self, event: Event) -> None:
         if event.type in CAMERA_EVENT_ATTR_MAP and event.camera is not None:
             _process_camera_event(event)
         elif event.type == EventType.MOTION_LIGHT and event.light is not None:
@@ -332,8 +343,19 @@ class Bootstrap(ProtectBaseObject):
         elif event.type == EventType.MOTION_SENSOR and event.sensor is not None:
             _process_sensor_event(event)
 
+    def process_event(self, event: Event) -> None:
+        self._process_event_device(event)
         self.events[event.id] = event
 
+    def process_events(self, events: Iterable[Event]) -> None:
+        """Processes multiple events at once, in order."""
+        new_events: dict[str, Event] = {}
+        for event in events:
+            self._process_event_device(event)
+            new_events[event.id] = event
+
+        self.events.update(new_events)
+
     def _create_stat(
         self,
         packet: WSPacket,
@@ -546,6 +568,8 @@ class Bootstrap(ProtectBaseObject):
         action, data = self._get_frame_data(packet)
         if action["newUpdateId"] is not None:
             self.last_update_id = UUID(action["newUpdateId"])
+            # keep the string from the packet so it does not need to be re-encoded
+            self._last_update_id_str = (self.last_update_id, action["newUpdateId"])
 
         if action["modelKey"] not in ModelType.values():
             _LOGGER.debug("Unknown model type: %s", action["modelKey"])
@@ -24,6 +24,7 @@ from pyunifiprotect.data.base import (
 from pyunifiprotect.data.types import (
     DEFAULT,
     DEFAULT_TYPE,
+    DOORBELL_MESSAGE_TEXT,
     AudioCodecs,
     AudioStyle,
     AutoExposureMode,
@@ -66,7 +67,6 @@ from pyunifiprotect.utils import (
     convert_smart_types,
     convert_video_modes,
     from_js_time,
-    process_datetime,
     serialize_point,
     to_js_time,
     utc_now,
@@ -474,8 +474,6 @@ class LCDMessage(ProtectBaseObject):
 
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "resetAt" in data:
-            data["resetAt"] = process_datetime(data, "resetAt")
         if "text" in data:
             # UniFi Protect bug: some times LCD messages can get into a bad state where message = DEFAULT MESSAGE, but no type
             if "type" not in data:
@@ -491,7 +489,7 @@ class LCDMessage(ProtectBaseObject):
             text_type = cls.type.value
 
         if text_type != DoorbellMessageType.CUSTOM_MESSAGE.value:
-            text = text_type.replace("_", " ")
+            text = DOORBELL_MESSAGE_TEXT.get(text_type) or text_type.replace("_", " ")
 
         return text
 
@@ -563,27 +561,6 @@ class VideoStats(ProtectBaseObject):
             "timelapseEndLQ": "timelapseEndLq",
         }
 
-    @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "recordingStart" in data:
-            data["recordingStart"] = process_datetime(data, "recordingStart")
-        if "recordingEnd" in data:
-            data["recordingEnd"] = process_datetime(data, "recordingEnd")
-        if "recordingStartLQ" in data:
-            data["recordingStartLQ"] = process_datetime(data, "recordingStartLQ")
-        if "recordingEndLQ" in data:
-            data["recordingEndLQ"] = process_datetime(data, "recordingEndLQ")
-        if "timelapseStart" in data:
-            data["timelapseStart"] = process_datetime(data, "timelapseStart")
-        if "timelapseEnd" in data:
-            data["timelapseEnd"] = process_datetime(data, "timelapseEnd")
-        if "timelapseStartLQ" in data:
-            data["timelapseStartLQ"] = process_datetime(data, "timelapseStartLQ")
-        if "timelapseEndLQ" in data:
-            data["timelapseEndLQ"] = process_datetime(data, "timelapseEndLQ")
-
-        return super().unifi_dict_to_dict(data)
-
 
 class StorageStats(ProtectBaseObject):
     used: Optional[int]  # bytes
@@ -2240,7 +2217,7 @@ class Camera(ProtectMotionDeviceModel):
         if text_type != DoorbellMessageType.CUSTOM_MESSAGE:
             if text is not None:
                 raise BadRequest("Can only set text if text_type is CUSTOM_MESSAGE")
-            text = text_type.value.replace("_", " ")
+            text = DOORBELL_MESSAGE_TEXT[text_type]
 
         if reset_at == DEFAULT:
             reset_at = (
@@ -7,12 +7,10 @@ from functools import cache
 from ipaddress import IPv4Address, IPv6Address
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
+from typing import Any, ClassVar, Literal, Optional, Union
 from uuid import UUID
 import zoneinfo
 
-import aiofiles
-from aiofiles import os as aos
 import orjson
 
 from pyunifiprotect.data.base import (
@@ -22,6 +20,7 @@ from pyunifiprotect.data.base import (
 )
 from pyunifiprotect.data.devices import Camera, CameraZone, Light, Sensor
 from pyunifiprotect.data.types import (
+    DOORBELL_MESSAGE_TEXT,
     AnalyticsOption,
     DoorbellMessageType,
     DoorbellText,
@@ -45,25 +44,61 @@ from pyunifiprotect.data.types import (
 )
 from pyunifiprotect.data.user import User, UserLocation
 from pyunifiprotect.exceptions import BadRequest, NotAuthorized
-from pyunifiprotect.utils import RELEASE_CACHE, process_datetime
+from pyunifiprotect.utils import RELEASE_CACHE, from_ms
 
 try:
     from pydantic.v1.fields import PrivateAttr
 except ImportError:
     from pydantic.fields import PrivateAttr
 
-if TYPE_CHECKING:
-    try:
-        from pydantic.v1.typing import SetStr
-    except ImportError:
-        from pydantic.typing import SetStr
-
 
 _LOGGER = logging.getLogger(__name__)
 MAX_SUPPORTED_CAMERAS = 256
 MAX_EVENT_HISTORY_IN_STATE_MACHINE = MAX_SUPPORTED_CAMERAS * 2
 DELETE_KEYS_THUMB = {"color", "vehicleType"}
 DELETE_KEYS_EVENT = {"deletedAt", "category", "subCategory"}
+COLLAPSE_KEYS_METADATA = frozenset(
+    {
+        "lightId",
+        "lightName",
+        "sensorId",
+        "sensorName",
+        "sensorType",
+        "doorlockId",
+        "doorlockName",
+        "mountType",
+        "status",
+        "alarmType",
+        "deviceId",
+        "mac",
+        "type",
+    },
+)
+# collapsed metadata keys that need no special casing
+COLLAPSE_KEYS_METADATA_NON_TYPE = COLLAPSE_KEYS_METADATA - {"type"}
+# AI Theta/Hotplug metadata types that are not collapsed
+METADATA_TYPE_PASSTHROUGH = frozenset({"audio", "video", "extender"})
+STORAGE_TYPES: dict[str, StorageType] = {t.value: t for t in StorageType}
+DELETE_KEYS_NO_DISK = {
+    "action",
+    "ata",
+    "bad_sector",
+    "estimate",
+    "firmware",
+    "healthy",
+    "life_span",
+    "model",
+    "poweronhrs",
+    "progress",
+    "reason",
+    "rpm",
+    "sata",
+    "serial",
+    "tempature",
+    "temperature",
+    "threshold",
+    "type",
+}
 
 
 class NVRLocation(UserLocation):
@@ -92,7 +127,7 @@ class SmartDetectItem(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "duration" in data:
-            data["duration"] = timedelta(milliseconds=data["duration"])
+            data["duration"] = from_ms(data["duration"])
 
         return super().unifi_dict_to_dict(data)
 
@@ -142,8 +177,8 @@ class EventThumbnailAttributes(ProtectBaseObject):
     ) -> dict[str, Any]:
         data = super().unifi_dict(data=data, exclude=exclude)
 
-        for key in DELETE_KEYS_THUMB.intersection(data.keys()):
-            if data[key] is None:
+        for key in DELETE_KEYS_THUMB:
+            if key in data and data[key] is None:
                 del data[key]
 
         return data
@@ -156,13 +191,6 @@ class EventDetectedThumbnail(ProtectBaseObject):
     attributes: Optional[EventThumbnailAttributes] = None
     name: Optional[str]
 
-    @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "clockBestWall" in data:
-            data["clockBestWall"] = process_datetime(data, "clockBestWall")
-
-        return super().unifi_dict_to_dict(data)
-
     def unifi_dict(
         self,
         data: Optional[dict[str, Any]] = None,
@@ -200,21 +228,7 @@ class EventMetadata(ProtectBaseObject):
     # requires 2.11.13+
     detected_thumbnails: Optional[list[EventDetectedThumbnail]] = None
 
-    _collapse_keys: ClassVar[SetStr] = {
-        "lightId",
-        "lightName",
-        "type",
-        "sensorId",
-        "sensorName",
-        "sensorType",
-        "doorlockId",
-        "doorlockName",
-        "mountType",
-        "status",
-        "alarmType",
-        "deviceId",
-        "mac",
-    }
+    _collapse_keys: ClassVar[frozenset[str]] = COLLAPSE_KEYS_METADATA
 
     @classmethod
     @cache
@@ -227,9 +241,10 @@ class EventMetadata(ProtectBaseObject):
 
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        for key in cls._collapse_keys.intersection(data.keys()):
-            if isinstance(data[key], dict):
-                data[key] = data[key]["text"]
+        collapse_keys = cls._collapse_keys
+        for key, value in data.items():
+            if key in collapse_keys and isinstance(value, dict):
+                data[key] = value["text"]
 
         return super().unifi_dict_to_dict(data)
 
@@ -241,15 +256,16 @@ class EventMetadata(ProtectBaseObject):
         data = super().unifi_dict(data=data, exclude=exclude)
 
         # all metadata keys optionally appear
-        for key, value in list(data.items()):
-            if value is None:
-                del data[key]
+        data = {key: value for key, value in data.items() if value is not None}
 
-        for key in self._collapse_keys.intersection(data.keys()):
-            # AI Theta/Hotplug exception
-            if key != "type" or data[key] not in {"audio", "video", "extender"}:
+        for key in COLLAPSE_KEYS_METADATA_NON_TYPE:
+            if key in data:
                 data[key] = {"text": data[key]}
 
+        # AI Theta/Hotplug exception
+        if "type" in data and data["type"] not in METADATA_TYPE_PASSTHROUGH:
+            data["type"] = {"text": data["type"]}
+
         return data
 
 
@@ -293,13 +309,6 @@ class Event(ProtectModelWithId):
             "smartDetectEvents": "smartDetectEventIds",
         }
 
-    @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        for key in {"start", "end", "timestamp", "deletedAt"}.intersection(data.keys()):
-            data[key] = process_datetime(data, key)
-
-        return super().unifi_dict_to_dict(data)
-
     def unifi_dict(
         self,
         data: Optional[dict[str, Any]] = None,
@@ -307,8 +316,8 @@ class Event(ProtectModelWithId):
     ) -> dict[str, Any]:
         data = super().unifi_dict(data=data, exclude=exclude)
 
-        for key in DELETE_KEYS_EVENT.intersection(data.keys()):
-            if data[key] is None:
+        for key in DELETE_KEYS_EVENT:
+            if key in data and data[key] is None:
                 del data[key]
 
         return data
@@ -346,10 +355,11 @@ class Event(ProtectModelWithId):
         if self._smart_detect_events is not None:
             return self._smart_detect_events
 
+        events = self.api.bootstrap.events
         self._smart_detect_events = [
-            self.api.bootstrap.events[g]
-            for g in self.smart_detect_event_ids
-            if g in self.api.bootstrap.events
+            event
+            for event in (events.get(g) for g in self.smart_detect_event_ids)
+            if event is not None
         ]
         return self._smart_detect_events
 
@@ -481,7 +491,7 @@ class Event(ProtectModelWithId):
 
             ids: set[int] = set()
             for item in smart_track.payload:
-                ids = ids | set(item.zone_ids)
+                ids.update(item.zone_ids)
 
             self._smart_detect_zones = {
                 z.id: z for z in self.camera.smart_detect_zones if z.id in ids
@@ -555,12 +565,14 @@ class StorageInfo(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "type" in data:
-            storage_type = data.pop("type")
-            try:
-                data["type"] = StorageType(storage_type)
-            except ValueError:
-                _LOGGER.warning("Unknown storage type: %s", storage_type)
-                data["type"] = StorageType.UNKNOWN
+            storage_type = data["type"]
+            value = STORAGE_TYPES.get(storage_type)
+            if value is None:
+                # falls back to case-insensitive match or UNKNOWN
+                value = StorageType(storage_type)
+                if value is StorageType.UNKNOWN:
+                    _LOGGER.warning("Unknown storage type: %s", storage_type)
+            data["type"] = value
 
         return super().unifi_dict_to_dict(data)
 
@@ -615,7 +627,7 @@ class UOSDisk(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "estimate" in data and data["estimate"] is not None:
-            data["estimate"] = timedelta(seconds=data.pop("estimate"))
+            data["estimate"] = timedelta(seconds=data["estimate"])
 
         return super().unifi_dict_to_dict(data)
 
@@ -630,30 +642,9 @@ class UOSDisk(ProtectBaseObject):
         if "estimate" in data and data["estimate"] is not None:
             data["estimate"] = data["estimate"] / 1000
 
-        if "state" in data and data["state"] == "nodisk":
-            delete_keys = [
-                "action",
-                "ata",
-                "bad_sector",
-                "estimate",
-                "firmware",
-                "healthy",
-                "life_span",
-                "model",
-                "poweronhrs",
-                "progress",
-                "reason",
-                "rpm",
-                "sata",
-                "serial",
-                "tempature",
-                "temperature",
-                "threshold",
-                "type",
-            ]
-            for key in delete_keys:
-                if key in data:
-                    del data[key]
+        if data.get("state") == "nodisk":
+            for key in DELETE_KEYS_NO_DISK:
+                data.pop(key, None)
 
         return data
 
@@ -696,7 +687,7 @@ class UOSSpace(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "estimate" in data and data["estimate"] is not None:
-            data["estimate"] = timedelta(seconds=data.pop("estimate"))
+            data["estimate"] = timedelta(seconds=data["estimate"])
 
         return super().unifi_dict_to_dict(data)
 
@@ -747,6 +738,19 @@ class DoorbellMessage(ProtectBaseObject):
     text: DoorbellText
 
 
+# built-in messages that always precede the custom ones in `all_messages`
+DEFAULT_DOORBELL_MESSAGES = tuple(
+    DoorbellMessage(
+        type=message_type,
+        text=DOORBELL_MESSAGE_TEXT[message_type],  # type: ignore[arg-type]
+    )
+    for message_type in (
+        DoorbellMessageType.LEAVE_PACKAGE_AT_DOOR,
+        DoorbellMessageType.DO_NOT_DISTURB,
+    )
+)
+
+
 class DoorbellSettings(ProtectBaseObject):
     default_message_text: DoorbellText
     default_message_reset_timeout: timedelta
@@ -764,8 +768,8 @@ class DoorbellSettings(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "defaultMessageResetTimeoutMs" in data:
-            data["defaultMessageResetTimeout"] = timedelta(
-                milliseconds=data.pop("defaultMessageResetTimeoutMs"),
+            data["defaultMessageResetTimeout"] = from_ms(
+                data.pop("defaultMessageResetTimeoutMs"),
             )
 
         return super().unifi_dict_to_dict(data)
@@ -798,11 +802,9 @@ class StorageDistribution(ProtectBaseObject):
         self,
     ) -> dict[RecordingType, RecordingTypeDistribution]:
         if self._recording_type_dict is None:
-            self._recording_type_dict = {}
-            for recording_type in self.recording_type_distributions:
-                self._recording_type_dict[
-                    recording_type.recording_type
-                ] = recording_type
+            self._recording_type_dict = {
+                r.recording_type: r for r in self.recording_type_distributions
+            }
 
         return self._recording_type_dict
 
@@ -810,9 +812,9 @@ class StorageDistribution(ProtectBaseObject):
         self,
     ) -> dict[ResolutionStorageType, ResolutionDistribution]:
         if self._resolution_dict is None:
-            self._resolution_dict = {}
-            for resolution in self.resolution_distributions:
-                self._resolution_dict[resolution.resolution] = resolution
+            self._resolution_dict = {
+                r.resolution: r for r in self.resolution_distributions
+            }
 
         return self._resolution_dict
 
@@ -858,11 +860,9 @@ class StorageStats(ProtectBaseObject):
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
         if "capacity" in data and data["capacity"] is not None:
-            data["capacity"] = timedelta(milliseconds=data.pop("capacity"))
+            data["capacity"] = from_ms(data["capacity"])
         if "remainingCapacity" in data and data["remainingCapacity"] is not None:
-            data["remainingCapacity"] = timedelta(
-                milliseconds=data.pop("remainingCapacity"),
-            )
+            data["remainingCapacity"] = from_ms(data["remainingCapacity"])
 
         return super().unifi_dict_to_dict(data)
 
@@ -957,6 +957,8 @@ class NVR(ProtectDeviceModel):
     # cameraCapacity
     # deviceFirmwareSettings
 
+    _release_versions: Optional[set[Version]] = PrivateAttr(None)
+
     @classmethod
     @cache
     def _get_unifi_remaps(cls) -> dict[str, str]:
@@ -991,19 +993,12 @@ class NVR(ProtectDeviceModel):
 
     @classmethod
     def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if "lastUpdateAt" in data:
-            data["lastUpdateAt"] = process_datetime(data, "lastUpdateAt")
-        if "lastDeviceFwUpdatesCheckedAt" in data:
-            data["lastDeviceFwUpdatesCheckedAt"] = process_datetime(
-                data,
-                "lastDeviceFwUpdatesCheckedAt",
-            )
         if (
             "recordingRetentionDurationMs" in data
             and data["recordingRetentionDurationMs"] is not None
         ):
-            data["recordingRetentionDuration"] = timedelta(
-                milliseconds=data.pop("recordingRetentionDurationMs"),
+            data["recordingRetentionDuration"] = from_ms(
+                data.pop("recordingRetentionDurationMs"),
             )
         if "timezone" in data and not isinstance(data["timezone"], tzinfo):
             data["timezone"] = zoneinfo.ZoneInfo(data["timezone"])
@@ -1019,7 +1014,7 @@ class NVR(ProtectDeviceModel):
 
     @property
     def protect_url(self) -> str:
-        return f"{self.api.base_url}/protect/devices/{self.api.bootstrap.nvr.id}"
+        return f"{self.api.base_url}/protect/devices/{self.id}"
 
     @property
     def display_name(self) -> str:
@@ -1031,21 +1026,21 @@ class NVR(ProtectDeviceModel):
 
         if len(self.vault_camera_ids) == 0:
             return []
-        return [self.api.bootstrap.cameras[c] for c in self.vault_camera_ids]
+
+        # skip ids for cameras that are not (or no longer) in bootstrap
+        cameras = self.api.bootstrap.cameras
+        return [
+            camera
+            for camera in (cameras.get(c) for c in self.vault_camera_ids)
+            if camera is not None
+        ]
 
     def update_all_messages(self) -> None:
         """Updates doorbell_settings.all_messages after adding/removing custom message"""
 
         messages = self.doorbell_settings.custom_messages
         self.doorbell_settings.all_messages = [
-            DoorbellMessage(
-                type=DoorbellMessageType.LEAVE_PACKAGE_AT_DOOR,
-                text=DoorbellMessageType.LEAVE_PACKAGE_AT_DOOR.value.replace("_", " "),  # type: ignore[arg-type]
-            ),
-            DoorbellMessage(
-                type=DoorbellMessageType.DO_NOT_DISTURB,
-                text=DoorbellMessageType.DO_NOT_DISTURB.value.replace("_", " "),  # type: ignore[arg-type]
-            ),
+            *DEFAULT_DOORBELL_MESSAGES,
             *(
                 DoorbellMessage(
                     type=DoorbellMessageType.CUSTOM_MESSAGE,
@@ -1139,10 +1134,8 @@ class NVR(ProtectDeviceModel):
         if file_path.is_file():
             try:
                 _LOGGER.debug("Reading release cache file: %s", file_path)
-                async with aiofiles.open(file_path, "rb") as cache_file:
-                    versions = {
-                        Version(v) for v in orjson.loads(await cache_file.read())
-                    }
+                data = await asyncio.to_thread(file_path.read_bytes)
+                versions = {Version(v) for v in orjson.loads(data)}
             except Exception:
                 _LOGGER.warning("Failed to parse cache file: %s", file_path)
 
@@ -1155,6 +1148,13 @@ class NVR(ProtectDeviceModel):
         if self.version.is_prerelease:
             return True
 
+        # known release versions only grow, so a hit never needs a re-read
+        if (
+            self._release_versions is not None
+            and self.version in self._release_versions
+        ):
+            return False
+
         # 2.6.14 is an EA version that looks like a release version
         cache_file_path = self.api.cache_dir / "release_cache.json"
         versions = await self._read_cache_file(
@@ -1164,23 +1164,40 @@ class NVR(ProtectDeviceModel):
             versions = await self.api.get_release_versions()
             try:
                 _LOGGER.debug("Fetching releases from APT repos...")
-                tmp = self.api.cache_dir / "release_cache.tmp.json"
-                await aos.makedirs(self.api.cache_dir, exist_ok=True)
-                async with aiofiles.open(tmp, "wb") as cache_file:
-                    await cache_file.write(orjson.dumps([str(v) for v in versions]))
-                await aos.rename(tmp, cache_file_path)
+                await asyncio.to_thread(
+                    _write_cache_file,
+                    cache_file_path,
+                    orjson.dumps([str(v) for v in versions]),
+                )
             except Exception:
                 _LOGGER.warning("Failed write cache file.")
 
+        self._release_versions = versions
         return self.version not in versions
 
 
+def _write_cache_file(file_path: Path, data: bytes) -> None:
+    """Writes the release cache file (blocking)."""
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # cold cache: nothing to replace, so write the file directly
+    try:
+        with file_path.open("xb") as cache_file:
+            cache_file.write(data)
+    except FileExistsError:
+        # existing cache: swap in the new contents atomically
+        tmp = file_path.with_suffix(".tmp.json")
+        tmp.write_bytes(data)
+        tmp.replace(file_path)
+
+
 class LiveviewSlot(ProtectBaseObject):
     camera_ids: list[str]
     cycle_mode: str
     cycle_interval: int
 
     _cameras: Optional[list[Camera]] = PrivateAttr(None)
+    _cameras_key: tuple[str, ...] = PrivateAttr(())
 
     @classmethod
     @cache
@@ -1189,9 +1206,12 @@ class LiveviewSlot(ProtectBaseObject):
 
     @property
     def cameras(self) -> list[Camera]:
-        if self._cameras is not None:
+        # rebuild if camera_ids changed since the list was cached
+        key = tuple(self.camera_ids)
+        if self._cameras is not None and self._cameras_key == key:
             return self._cameras
 
+        self._cameras_key = key
         # user may not have permission to see the cameras in the liveview
         self._cameras = [
             self.api.bootstrap.cameras[g]
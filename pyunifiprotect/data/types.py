@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
 import enum
+from functools import cache
+from itertools import islice
 from typing import Any, Literal, Optional, TypeVar, Union
 
 from packaging.version import Version as BaseVersion
@@ -49,9 +51,17 @@ class FixSizeOrderedDict(dict[KT, VT]):
         if self._max_size > 0 and len(self) > 0 and len(self) > self._max_size:
             del self[next(iter(self.keys()))]
 
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update multiple items, then trim back down to the max size."""
+        dict.update(self, *args, **kwargs)
+        if self._max_size > 0 and len(self) > self._max_size:
+            for key in list(islice(self, len(self) - self._max_size)):
+                del self[key]
+
 
 class ValuesEnumMixin:
     _values: Optional[list[str]] = None
+    _values_set: Optional[frozenset[str]] = None
     _values_normalized: Optional[dict[str, str]] = None
 
     @classmethod
@@ -60,6 +70,12 @@ class ValuesEnumMixin:
             cls._values = [e.value for e in cls]  # type: ignore[attr-defined]
         return cls._values
 
+    @classmethod
+    def values_set(cls) -> frozenset[str]:
+        if cls._values_set is None:
+            cls._values_set = frozenset(cls.values())
+        return cls._values_set
+
     @classmethod
     def _missing_(cls, value: Any) -> Optional[Any]:
         if cls._values_normalized is None:
@@ -208,6 +224,11 @@ class EventType(str, ValuesEnumMixin, enum.Enum):
             EventType.SMART_DETECT.value,
         ]
 
+    @staticmethod
+    @cache
+    def device_events_set() -> frozenset[str]:
+        return frozenset(EventType.device_events())
+
     @staticmethod
     def motion_events() -> list[str]:
         return [EventType.MOTION.value, EventType.SMART_DETECT.value]
@@ -304,6 +325,14 @@ class DoorbellMessageType(str, ValuesEnumMixin, enum.Enum):
     CUSTOM_MESSAGE = "CUSTOM_MESSAGE"
 
 
+# display text for the built-in (non custom) doorbell messages
+DOORBELL_MESSAGE_TEXT: dict[str, str] = {
+    t.value: t.value.replace("_", " ")
+    for t in DoorbellMessageType
+    if t is not DoorbellMessageType.CUSTOM_MESSAGE
+}
+
+
 @enum.unique
 class LightModeEnableType(str, ValuesEnumMixin, enum.Enum):
     DARK = "dark"
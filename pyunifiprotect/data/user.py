@@ -142,7 +142,7 @@ class User(ProtectModelWithId):
     # notifications
 
     _groups: Optional[list[Group]] = PrivateAttr(None)
-    _perm_cache: dict[str, bool] = PrivateAttr({})
+    _perm_cache: dict[tuple[ModelType, PermissionNode, str], bool] = PrivateAttr({})
 
     def __init__(self, **data: Any) -> None:
         if "permissions" in data:
@@ -174,6 +174,16 @@ class User(ProtectModelWithId):
     def _get_unifi_remaps(cls) -> dict[str, str]:
         return {**super()._get_unifi_remaps(), "groups": "groupIds"}
 
+    def update_from_dict(self, data: dict[str, Any]) -> User:
+        # cached permission checks are stale once permissions or groups change
+        if "group_ids" in data:
+            self._groups = None
+            self._perm_cache = {}
+        elif "permissions" in data or "all_permissions" in data:
+            self._perm_cache = {}
+
+        return super().update_from_dict(data)
+
     def unifi_dict(
         self,
         data: Optional[dict[str, Any]] = None,
@@ -213,26 +223,24 @@ class User(ProtectModelWithId):
 
         check_self = False
         if model == self.model and obj is not None and obj.id == self.id:
-            perm_str = f"{model.value}:{node.value}:$"
+            perm_key = (model, node, "$")
             check_self = True
         else:
-            perm_str = (
-                f"{model.value}:{node.value}:{obj.id if obj is not None else '*'}"
-            )
-        if perm_str in self._perm_cache:
-            return self._perm_cache[perm_str]
+            perm_key = (model, node, obj.id if obj is not None else "*")
+        if (cached := self._perm_cache.get(perm_key)) is not None:
+            return cached
 
         for perm in self.all_permissions:
             if model != perm.model or node not in perm.nodes:
                 continue
             if perm.obj_ids is None:
-                self._perm_cache[perm_str] = True
+                self._perm_cache[perm_key] = True
                 return True
             if check_self and perm.obj_ids == {"self"}:
-                self._perm_cache[perm_str] = True
+                self._perm_cache[perm_key] = True
                 return True
             if perm.obj_ids is not None and obj is not None and obj.id in perm.obj_ids:
-                self._perm_cache[perm_str] = True
+                self._perm_cache[perm_key] = True
                 return True
-        self._perm_cache[perm_str] = False
+        self._perm_cache[perm_key] = False
         return False
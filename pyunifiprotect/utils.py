@@ -20,6 +20,7 @@ import os
 from pathlib import Path
 import re
 import socket
+import ssl
 import sys
 import time
 from typing import TYPE_CHECKING, Any, Optional, Union, overload
@@ -28,6 +29,7 @@ import zoneinfo
 
 from aiohttp import ClientResponse
 import jwt
+import orjson
 
 from pyunifiprotect.data.types import (
     Color,
@@ -119,7 +121,7 @@ async def get_response_reason(response: ClientResponse) -> str:
     reason = str(response.reason)
 
     try:
-        data = await response.json()
+        data = orjson.loads(await response.read())
         reason = data.get("error", str(data))
     except Exception:
         with contextlib.suppress(Exception):
@@ -128,6 +130,21 @@ async def get_response_reason(response: ClientResponse) -> str:
     return reason
 
 
+def create_ssl_context(verify_ssl: bool) -> Union[bool, ssl.SSLContext]:
+    """
+    Creates the SSL setting to use for all connections to the NVR.
+
+    Verified connections use aiohttp's own default context.
+    """
+    if verify_ssl:
+        return True
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
 @overload
 def to_js_time(dt: datetime | int) -> int:
     ...
@@ -162,6 +179,13 @@ def to_ms(duration: Optional[timedelta]) -> Optional[int]:
     return int(round(duration.total_seconds() * 1000))
 
 
+def from_ms(duration: float) -> timedelta:
+    """Converts Milliseconds to python timedelta"""
+
+    # positional args avoid keyword parsing in `timedelta.__new__`
+    return timedelta(0, 0, 0, duration)
+
+
 def utc_now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
@@ -232,15 +256,30 @@ def convert_unifi_data(value: Any, field: ModelField) -> Any:
     if shape == SHAPE_DICT and isinstance(value, dict):
         return {k: convert_unifi_data(v, field) for k, v in value.items()}
 
-    if value is not None:
-        if type_ in IP_TYPES:
-            try:
-                return ip_address(value)
-            except ValueError:
-                return value
-        if type_ == datetime:
-            return from_js_time(value)
-        if type_ in _CREATE_TYPES or (isclass(type_) and issubclass(type_, Enum)):
+    if value is not None and (converter := _get_unifi_converter(type_)) is not None:
+        return converter(value)
+
+    return value
+
+
+def _convert_ip(value: Any) -> Any:
+    try:
+        return ip_address(value)
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=512)
+def _get_unifi_converter(type_: Any) -> Optional[Callable[[Any], Any]]:
+    """Gets the function used by `convert_unifi_data` to convert values for `type_`, if any."""
+
+    if type_ in IP_TYPES:
+        return _convert_ip
+    if type_ == datetime:
+        return from_js_time
+    if type_ in _CREATE_TYPES or (isclass(type_) and issubclass(type_, Enum)):
+
+        def _create(value: Any) -> Any:
             # cannot do this check too soon because some types cannot be used in isinstance
             if isinstance(value, type_):
                 return value
@@ -250,7 +289,9 @@ def convert_unifi_data(value: Any, field: ModelField) -> Any:
                 value = "0" * 32
             return type_(value)
 
-    return value
+        return _create
+
+    return None
 
 
 def serialize_unifi_obj(value: Any) -> Any:
@@ -349,7 +390,9 @@ def convert_video_modes(items: Iterable[str]) -> list[VideoMode]:
     return types
 
 
+@lru_cache(maxsize=16)
 def ip_from_host(host: str) -> IPv4Address | IPv6Address:
+    """Resolves a host to an IP address, cached to avoid repeat blocking DNS lookups."""
     try:
         return ip_address(host)
     except ValueError:
@@ -380,6 +423,18 @@ def dict_diff(orig: Optional[dict[str, Any]], new: dict[str, Any]) -> dict[str,
     return changed
 
 
+def dict_merge(orig: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merges `new` into `orig` in place."""
+
+    for key, value in new.items():
+        if isinstance(value, dict) and isinstance(orig.get(key), dict):
+            dict_merge(orig[key], value)
+        else:
+            orig[key] = deepcopy(value)
+
+    return orig
+
+
 def ws_stat_summmary(
     stats: list[WSStat],
 ) -> tuple[list[WSStat], float, Counter[str], Counter[str], Counter[str]]:
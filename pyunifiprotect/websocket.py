@@ -33,7 +33,7 @@ class Websocket:
     backoff: int
     _auth: CALLBACK_TYPE
     _timeout: float
-    _ws_subscriptions: list[Callable[[WSMessage], None]]
+    _ws_subscriptions: dict[object, Callable[[WSMessage], None]]
     _connect_lock: asyncio.Lock
 
     _headers: Optional[dict[str, str]] = None
@@ -60,7 +60,7 @@ class Websocket:
         self.verify = verify
         self._auth = auth_callback
         self._timeout = time.monotonic()
-        self._ws_subscriptions = []
+        self._ws_subscriptions = {}
         self._connect_lock = asyncio.Lock()
 
     @property
@@ -77,7 +77,8 @@ class Websocket:
             _LOGGER.exception("Error from Websocket: %s", msg.data)
             return False
 
-        for sub in self._ws_subscriptions:
+        # copy so handlers can unsubscribe while the message is dispatched
+        for sub in tuple(self._ws_subscriptions.values()):
             try:
                 sub(msg)
             except Exception:
@@ -221,9 +222,11 @@ class Websocket:
         Returns a callback that will unsubscribe.
         """
 
+        key = object()
+
         def _unsub_ws_callback() -> None:
-            self._ws_subscriptions.remove(ws_callback)
+            self._ws_subscriptions.pop(key, None)
 
         _LOGGER.debug("Adding subscription: %s", ws_callback)
-        self._ws_subscriptions.append(ws_callback)
+        self._ws_subscriptions[key] = ws_callback
         return _unsub_ws_callback
@@ -7,8 +7,9 @@ import base64
 from copy import deepcopy
 from datetime import timedelta
 from ipaddress import IPv4Address
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, cast
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -19,8 +20,10 @@ from pyunifiprotect.data import (
     Event,
     EventType,
     FixSizeOrderedDict,
+    Liveview,
     ModelType,
     Permission,
+    PermissionNode,
     RecordingMode,
     SmartDetectObjectType,
     StorageType,
@@ -29,8 +32,10 @@ from pyunifiprotect.data import (
     WSPacket,
     create_from_unifi_dict,
 )
+from pyunifiprotect.data.base import ProtectBaseObject, ProtectModel
 from pyunifiprotect.data.devices import LCDMessage
-from pyunifiprotect.data.types import RecordingType, ResolutionStorageType
+from pyunifiprotect.data.nvr import _write_cache_file
+from pyunifiprotect.data.types import RecordingType, ResolutionStorageType, Version
 from pyunifiprotect.exceptions import BadRequest, NotAuthorized, StreamError
 from pyunifiprotect.utils import set_debug, set_no_debug, utc_now
 from tests.conftest import (
@@ -38,6 +43,7 @@ from tests.conftest import (
     TEST_CAMERA_EXISTS,
     TEST_DOORLOCK_EXISTS,
     TEST_LIGHT_EXISTS,
+    TEST_LIVEVIEW_EXISTS,
     TEST_SENSOR_EXISTS,
     TEST_VIEWPORT_EXISTS,
     MockTalkback,
@@ -45,6 +51,11 @@ from tests.conftest import (
 )
 from tests.sample_data.constants import CONSTANTS
 
+try:
+    from pydantic.v1 import BaseModel, Field
+except ImportError:
+    from pydantic import BaseModel, Field
+
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -163,6 +174,66 @@ def test_bridge(bridge):
     compare_devices(bridge)
 
 
+def test_unifi_remaps_per_class():
+    assert ProtectModel._get_to_unifi_remaps() == {"model": "modelKey"}
+    assert Camera._get_to_unifi_remaps()["is2k"] == "is2K"
+    assert Event._unifi_remaps["camera"] == "cameraId"
+    assert "camera" not in Camera._unifi_remaps
+
+
+def test_read_only_fields_per_class():
+    assert Camera._read_only_fields == frozenset(Camera._get_read_only_fields())
+    assert "isDefault" not in Camera._read_only_fields
+    assert "isDefault" in Liveview._read_only_fields
+
+
+@pytest.mark.skipif(not TEST_CAMERA_EXISTS, reason="Missing testdata")
+def test_construct_defaults_not_shared(camera):
+    data = deepcopy(camera)
+    data.pop("lastSmartDetects", None)
+    set_no_debug()
+    obj1 = cast(Camera, create_from_unifi_dict(deepcopy(data)))
+    obj2 = cast(Camera, create_from_unifi_dict(deepcopy(data)))
+    set_debug()
+
+    assert obj1.last_smart_detects == {}
+    assert obj1.last_smart_detects is not obj2.last_smart_detects
+    assert "last_smart_detects" not in obj1.__fields_set__
+
+
+class ConstructModel(ProtectBaseObject):
+    name: str = "name"
+    count: int
+    tags: list[str] = []
+    aliased: int = Field(1, alias="aliasedValue")
+
+
+class PydanticConstructModel(BaseModel):
+    name: str = "name"
+    count: int
+    tags: list[str] = []
+    aliased: int = Field(1, alias="aliasedValue")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {},
+        {"tags": ["a"], "count": 1},
+        {"count": 1, "aliasedValue": 2, "name": "test"},
+        {"extra": True, "aliased": 3},
+    ],
+)
+def test_construct_matches_pydantic(values: dict[str, Any]):
+    obj = ConstructModel.construct(**deepcopy(values))
+    expected = PydanticConstructModel.construct(**deepcopy(values))
+
+    # same values in the same (field declaration) order
+    assert list(obj.__dict__.items()) == list(expected.__dict__.items())
+    assert obj.__fields_set__ == expected.__fields_set__
+    assert obj.tags is not ConstructModel.__fields__["tags"].default
+
+
 @pytest.mark.timeout(CONSTANTS["event_count"] * 0.1)
 def test_events(raw_events):
     for event in raw_events:
@@ -418,6 +489,14 @@ def test_fix_order_size_dict_max():
     assert d == {"test3": 3}
 
 
+def test_fix_order_size_dict_max_update():
+    d = FixSizeOrderedDict(max_size=2)
+    d["test"] = 1
+    d.update({"test2": 2, "test3": 3, "test4": 4})
+
+    assert d == {"test3": 3, "test4": 4}
+
+
 def test_fix_order_size_dict_negative_max():
     d = FixSizeOrderedDict(max_size=-1)
     d["test"] = 1
@@ -855,6 +934,58 @@ async def test_permissions_self_with_other(
     assert user2.can_delete(user1) is can_delete
 
 
+@pytest.mark.skipif(not TEST_CAMERA_EXISTS, reason="Missing testdata")
+def test_update_from_dict_no_debug(camera_obj: Camera):
+    camera_obj.lcd_message = None
+    set_no_debug()
+    try:
+        camera_obj.update_from_dict(
+            camera_obj.unifi_dict_to_dict(
+                {
+                    "lcdMessage": {"type": "LEAVE_PACKAGE_AT_DOOR", "text": "test"},
+                    "recordingSettings": {"mode": "never"},
+                    "name": "Updated",
+                },
+            ),
+        )
+    finally:
+        set_debug()
+
+    assert isinstance(camera_obj.lcd_message, LCDMessage)
+    assert camera_obj.lcd_message.type == DoorbellMessageType.LEAVE_PACKAGE_AT_DOOR
+    assert camera_obj.lcd_message.text == "LEAVE PACKAGE AT DOOR"
+    assert camera_obj.recording_settings.mode == RecordingMode.NEVER
+    assert camera_obj.name == "Updated"
+    assert "name" in camera_obj.__fields_set__
+
+
+@pytest.mark.asyncio()
+async def test_permissions_cache_reset(user_obj: User):
+    api = user_obj.api
+    user_obj.all_permissions = [
+        Permission.from_unifi_dict(rawPermission="camera:read:*", api=api),
+    ]
+    user_obj._perm_cache = {}
+
+    assert user_obj.can(ModelType.CAMERA, PermissionNode.READ) is True
+    assert user_obj.can(ModelType.CAMERA, PermissionNode.WRITE) is False
+
+    user_obj.update_from_dict(
+        {
+            "all_permissions": [
+                Permission.from_unifi_dict(rawPermission="camera:*:*", api=api),
+            ],
+        },
+    )
+
+    assert user_obj.can(ModelType.CAMERA, PermissionNode.WRITE) is True
+
+    user_obj.update_from_dict(user_obj.unifi_dict_to_dict({"groups": []}))
+
+    assert user_obj._perm_cache == {}
+    assert user_obj.groups == []
+
+
 @pytest.mark.skipif(not TEST_CAMERA_EXISTS, reason="Missing testdata")
 @pytest.mark.asyncio()
 async def test_revert(user_obj: User, camera_obj: Camera):
@@ -992,3 +1123,60 @@ def test_unknown_storage_type(
     )
     assert obj.nvr.system_info.storage.type == StorageType.UNKNOWN
     set_debug()
+
+
+def test_storage_type_case_insensitive(
+    bootstrap: dict[str, Any],
+    protect_client: ProtectApiClient,
+):
+    bootstrap["nvr"]["systemInfo"]["storage"]["type"] = "HDD"
+
+    obj: Bootstrap = Bootstrap.from_unifi_dict(
+        **deepcopy(bootstrap),
+        api=protect_client,
+    )
+    assert obj.nvr.system_info.storage.type == StorageType.DISK
+
+
+@pytest.mark.asyncio()
+async def test_nvr_release_cache(protect_client: ProtectApiClient, tmp_path: Path):
+    nvr = protect_client.bootstrap.nvr
+    nvr.version = Version("2.6.14")
+    protect_client.cache_dir = tmp_path / "cache"
+    versions = {Version("2.6.13"), Version("2.6.14")}
+    protect_client.get_release_versions = AsyncMock(return_value=versions)  # type: ignore[method-assign]
+
+    with patch("pyunifiprotect.data.nvr.RELEASE_CACHE", tmp_path / "missing.json"):
+        assert await nvr.get_is_prerelease() is False
+        assert (tmp_path / "cache" / "release_cache.json").is_file()
+        assert not (tmp_path / "cache" / "release_cache.tmp.json").exists()
+
+        # later calls are served from memory without touching the cache file
+        (tmp_path / "cache" / "release_cache.json").unlink()
+        assert await nvr.get_is_prerelease() is False
+    protect_client.get_release_versions.assert_called_once()
+
+
+def test_write_release_cache_file(tmp_path: Path):
+    cache_file = tmp_path / "cache" / "release_cache.json"
+
+    _write_cache_file(cache_file, b'["1.0.0"]')
+    assert cache_file.read_bytes() == b'["1.0.0"]'
+
+    _write_cache_file(cache_file, b'["1.0.0", "1.1.0"]')
+    assert cache_file.read_bytes() == b'["1.0.0", "1.1.0"]'
+    assert not (tmp_path / "cache" / "release_cache.tmp.json").exists()
+
+
+@pytest.mark.skipif(not TEST_LIVEVIEW_EXISTS, reason="Missing testdata")
+@pytest.mark.asyncio()
+async def test_liveview_slot_cameras_follow_ids(liveview_obj: Liveview):
+    slot = liveview_obj.slots[0]
+    camera = next(iter(liveview_obj.api.bootstrap.cameras.values()))
+
+    slot.camera_ids = [camera.id]
+    assert slot.cameras == [camera]
+    assert slot.cameras is slot.cameras
+
+    slot.camera_ids = []
+    assert slot.cameras == []
@@ -179,3 +179,13 @@ async def test_nvr_wan_ip(nvr_obj: NVR, ip: str, expected: IPv4Address | IPv6Add
     nvr = NVR.from_unifi_dict(**nvr_dict)
     assert nvr.wan_ip == expected
     assert nvr.unifi_dict()["wanIp"] == ip
+
+
+def test_nvr_vault_cameras_skips_missing(nvr_obj: NVR):
+    camera = next(iter(nvr_obj.api.bootstrap.cameras.values()))
+
+    nvr_obj.vault_camera_ids = [camera.id, "missing_id"]
+    assert nvr_obj.vault_cameras == [camera]
+
+    nvr_obj.vault_camera_ids = []
+    assert nvr_obj.vault_cameras == []
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import deepcopy
 from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
 from io import BytesIO
 from ipaddress import IPv4Address
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from pathlib import Path
+import ssl
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
 
 from PIL import Image
+import aiohttp
+import jwt
 import pytest
 
-from pyunifiprotect.api import ProtectApiClient
+from pyunifiprotect.api import (
+    DEVICE_MODEL_TYPES,
+    STREAM_READ_MIN_SIZE,
+    ProtectApiClient,
+)
 from pyunifiprotect.data import (
     Camera,
     Event,
@@ -20,12 +32,13 @@ from pyunifiprotect.data import (
     ModelType,
     create_from_unifi_dict,
 )
-from pyunifiprotect.data.types import VideoMode
+from pyunifiprotect.data.types import RecordingMode, Version, VideoMode
 from pyunifiprotect.exceptions import BadRequest, NvrError
 from pyunifiprotect.utils import to_js_time
 from tests.conftest import (
     TEST_BRIDGE_EXISTS,
     TEST_CAMERA_EXISTS,
+    TEST_CHIME_EXISTS,
     TEST_HEATMAP_EXISTS,
     TEST_LIGHT_EXISTS,
     TEST_LIVEVIEW_EXISTS,
@@ -164,6 +177,41 @@ def test_base_url(protect_client: ProtectApiClient):
 
     assert protect_client.base_url == "https://127.0.0.1"
     assert protect_client.ws_url == f"wss://127.0.0.1{arg}"
+    assert str(protect_client._api_base / "cameras") == (
+        "https://127.0.0.1/proxy/protect/api/cameras"
+    )
+
+
+def test_ws_url_cached(protect_client: ProtectApiClient):
+    url = protect_client.ws_url
+    assert protect_client.ws_url is url
+
+    protect_client.bootstrap.last_update_id = uuid4()
+    new_url = protect_client.ws_url
+    assert new_url != url
+    assert new_url.endswith(f"?lastUpdateId={protect_client.bootstrap.last_update_id}")
+
+
+def test_ws_url_pushed_after_read(protect_client: ProtectApiClient):
+    websocket = protect_client._websocket
+    assert websocket is not None
+
+    protect_client.bootstrap.last_update_id = uuid4()
+    # reading the URL must not stop it from being pushed to the websocket
+    url = protect_client.ws_url
+    assert websocket.url != url
+
+    with patch("pyunifiprotect.api.WSPacket"), patch.object(
+        type(protect_client.bootstrap),
+        "process_ws_packet",
+        return_value=None,
+    ):
+        protect_client._process_ws_message(Mock())
+
+    assert websocket.url == url
+    assert protect_client.bootstrap.last_update_id_str == str(
+        protect_client.bootstrap.last_update_id,
+    )
 
 
 def test_api_client_creation():
@@ -173,6 +221,267 @@ def test_api_client_creation():
     assert client
 
 
+@pytest.mark.asyncio()
+async def test_get_session_connector():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password", verify_ssl=False)
+
+    session = await client.get_session()
+    assert session.connector is client._connector
+    assert client._connector is not None
+    assert client._connector.limit_per_host == 16
+    assert not client._connector.force_close
+    assert isinstance(client._ssl_context, ssl.SSLContext)
+    assert client._ssl_context.verify_mode == ssl.CERT_NONE
+
+    await client.close_session()
+    assert client._connector is None
+
+
+@pytest.mark.asyncio()
+async def test_get_websocket_headers():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password", verify_ssl=False)
+    client.headers = {"x-csrf-token": "csrf"}
+
+    session = await client.get_session()
+    assert client._get_websocket_headers() == {"x-csrf-token": "csrf"}
+
+    session.cookie_jar.update_cookies({"TOKEN": "token"}, client._url)
+    assert client._get_websocket_headers() == {
+        "x-csrf-token": "csrf",
+        "cookie": "TOKEN=token",
+    }
+    assert client.headers == {"x-csrf-token": "csrf"}
+
+    await client.close_session()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("own_session", [True, False])
+async def test_token_cookie_ip_host(own_session: bool):
+    session = None if own_session else aiohttp.ClientSession()
+    client = ProtectApiClient(
+        "192.168.1.1",
+        443,
+        "username",
+        "password",
+        session=session,
+    )
+
+    cookies: SimpleCookie = SimpleCookie()
+    cookies["TOKEN"] = jwt.encode(
+        {"exp": int(time.time() + 3600)},
+        "secret",
+        algorithm="HS256",
+    )
+    cookies["TOKEN"]["path"] = "/"
+    token = cookies["TOKEN"].value
+
+    async def fake_request(method: str, url: Any, **kwargs: Any) -> Mock:
+        # what aiohttp does with the cookies of a response
+        client_session = await client.get_session()
+        client_session.cookie_jar.update_cookies(cookies, url)
+        return Mock(headers={"x-csrf-token": "csrf"}, cookies=cookies)
+
+    with patch.object(
+        aiohttp.ClientSession,
+        "request",
+        AsyncMock(side_effect=fake_request),
+    ) as mock_request:
+        await client.authenticate()
+        assert client.is_authenticated() is True
+
+        await client.request("get", "/api/test")
+
+    session = await client.get_session()
+    headers = mock_request.call_args.kwargs["headers"]
+    ws_headers = client._get_websocket_headers()
+    assert ws_headers is not None
+    assert ws_headers["cookie"] == f"TOKEN={token}"
+    if own_session:
+        # unsafe cookie jar, the session sends the cookie
+        assert "TOKEN" in session.cookie_jar.filter_cookies(client._url)
+        assert headers == {"x-csrf-token": "csrf"}
+    else:
+        # default cookie jar drops cookies for IP hosts
+        assert session.cookie_jar.filter_cookies(client._url) == {}
+        assert headers == {"x-csrf-token": "csrf", "Cookie": f"TOKEN={token}"}
+
+    await client.close_session()
+
+
+@pytest.mark.asyncio()
+async def test_request_json_body():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    client.headers = {"x-csrf-token": "csrf"}
+
+    response = Mock(cookies={})
+    session = Mock()
+    session.request = AsyncMock(return_value=response)
+    client.get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    await client.request("post", "/api/auth/login", json={"username": "test"})
+
+    kwargs = session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert kwargs["data"] == b'{"username":"test"}'
+    assert kwargs["headers"] == {
+        "x-csrf-token": "csrf",
+        "Content-Type": "application/json",
+    }
+    assert client.headers == {"x-csrf-token": "csrf"}
+
+    await client.request("get", "/api/test", headers={"range": "bytes=0-1"})
+
+    assert session.request.call_args.kwargs["headers"] == {
+        "x-csrf-token": "csrf",
+        "range": "bytes=0-1",
+    }
+    assert client.headers == {"x-csrf-token": "csrf"}
+
+
+@pytest.mark.asyncio()
+async def test_request_server_disconnected():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+
+    response = Mock(cookies={})
+    session = Mock()
+    session.request = AsyncMock(
+        side_effect=[aiohttp.ServerDisconnectedError(), response],
+    )
+    client.get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    assert await client.request("get", "/api/test") is response
+    assert session.request.call_count == 2
+
+    session.request = AsyncMock(side_effect=aiohttp.ServerDisconnectedError())
+    with pytest.raises(NvrError):
+        await client.request("get", "/api/test")
+    assert session.request.call_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_authenticate_csrf_token():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    client.request = AsyncMock(  # type: ignore[method-assign]
+        return_value=Mock(headers={"x-csrf-token": "csrf"}),
+    )
+
+    await client.authenticate()
+    assert client.headers == {"x-csrf-token": "csrf"}
+    assert client._is_authenticated is True
+
+    client.request.return_value = Mock(headers={})
+    await client.authenticate()
+    assert client.headers == {}
+
+
+def test_is_authenticated_token_expire():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    client._session = Mock()
+    client._is_authenticated = True
+
+    def set_token(exp: float) -> None:
+        cookies: SimpleCookie = SimpleCookie()
+        cookies["TOKEN"] = jwt.encode({"exp": int(exp)}, "secret", algorithm="HS256")
+        client._update_last_token_cookie(Mock(cookies=cookies))
+
+    assert client.is_authenticated() is False
+
+    set_token(time.time() + 3600)
+    assert client.is_authenticated() is True
+
+    # expires inside of TOKEN_COOKIE_MAX_EXP_SECONDS
+    set_token(time.time() + 30)
+    assert client.is_authenticated() is False
+
+    set_token(time.time() - 30)
+    assert client.is_authenticated() is False
+
+
+@pytest.mark.asyncio()
+async def test_get_versions_from_api():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    packages = (
+        "Package: unifi-protect\nArchitecture: arm64\nVersion: 2.1.1\n\n"
+        "Package: unifi-protect-beta\nVersion: 9.9.9\n\n"
+        "Package: other\nVersion: 1.0.0\n\n"
+        "Package: unifi-protect\nVersion: 2.2.0\n"
+    )
+    raw = packages.encode()
+
+    async def iter_chunked(size: int):
+        # split across package entries to test the buffering
+        for i in range(0, len(raw), 20):
+            yield raw[i : i + 20]
+
+    response = Mock()
+    response.content.iter_chunked = iter_chunked
+    session = MagicMock()
+    session.get.return_value.__aenter__.return_value = response
+    client.get_session = AsyncMock(return_value=session)  # type: ignore[method-assign]
+
+    versions = await client._get_versions_from_api("https://example.com/Packages")
+    assert versions == {Version("2.1.1"), Version("2.2.0")}
+
+
+@pytest.mark.asyncio()
+async def test_read_response_large():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    body = b"x" * (STREAM_READ_MIN_SIZE + 100)
+
+    async def iter_chunked(size: int):
+        for index in range(0, len(body), size):
+            yield body[index : index + size]
+
+    response = Mock()
+    response.content_length = len(body)
+    response.headers = {}
+    response.content.iter_chunked = iter_chunked
+    response.read = AsyncMock()
+
+    data = await client._read_response(response)
+
+    assert isinstance(data, bytearray)
+    assert data == body
+    response.read.assert_not_called()
+
+    response.content_length = 100
+    response.read = AsyncMock(return_value=b"small")
+    assert await client._read_response(response) == b"small"
+
+
+@pytest.mark.asyncio()
+async def test_api_request_raw_no_copy():
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    buffer = bytearray(b"x" * (STREAM_READ_MIN_SIZE + 100))
+    client.request = AsyncMock(return_value=Mock(status=200))  # type: ignore[method-assign]
+    client._read_response = AsyncMock(return_value=buffer)  # type: ignore[method-assign]
+
+    assert await client.api_request_raw("cameras/test/snapshot") is buffer
+
+
+@pytest.mark.parametrize(
+    ("extra", "match"),
+    [(100, "truncated"), (-50, "larger than expected")],
+)
+@pytest.mark.asyncio()
+async def test_read_response_size_mismatch(extra: int, match: str):
+    client = ProtectApiClient("127.0.0.1", 0, "username", "password")
+    body = b"x" * (STREAM_READ_MIN_SIZE + 100)
+
+    async def iter_chunked(size: int):
+        for index in range(0, len(body), size):
+            yield body[index : index + size]
+
+    response = Mock()
+    response.content_length = len(body) + extra
+    response.headers = {}
+    response.content.iter_chunked = iter_chunked
+
+    with pytest.raises(NvrError, match=match):
+        await client._read_response(response)
+
+
 def test_early_bootstrap():
     client = ProtectApiClient("127.0.0.1", 0, "username", "password", debug=True)
 
@@ -194,10 +503,12 @@ async def test_bootstrap_fix_record_mode(bootstrap):
     client.api_request_obj = AsyncMock(side_effect=[bootstrap, orig_bootstrap])
     client.update_device = AsyncMock()
 
-    await client.get_bootstrap()
+    bootstrap_obj = await client.get_bootstrap()
 
-    assert client.api_request_obj.call_count == 2
+    assert client.api_request_obj.call_count == 1
     assert client.update_device.call_count == expected_updates
+    camera = bootstrap_obj.cameras[bootstrap["cameras"][0]["id"]]
+    assert camera.recording_settings.mode == RecordingMode.DETECTIONS
 
 
 @pytest.mark.asyncio()
@@ -232,6 +543,119 @@ async def test_bootstrap_get_device_from_mac_bad_mac(bootstrap):
     assert camera is None
 
 
+@pytest.mark.asyncio()
+async def test_batch_updates(protect_client: ProtectApiClient):
+    protect_client.api_request.reset_mock()  # type: ignore[attr-defined]
+
+    async with protect_client.batch_updates():
+        await protect_client.update_device(
+            ModelType.CAMERA,
+            "cam1",
+            {"recordingSettings": {"mode": "always"}},
+        )
+        await protect_client.update_device(
+            ModelType.CAMERA,
+            "cam1",
+            {"recordingSettings": {"prePaddingSecs": 5}, "name": "Test"},
+        )
+        await protect_client.update_device(ModelType.LIGHT, "light1", {"name": "Test"})
+
+        protect_client.api_request.assert_not_called()  # type: ignore[attr-defined]
+
+    assert protect_client.api_request.call_count == 2  # type: ignore[attr-defined]
+    protect_client.api_request.assert_any_call(  # type: ignore[attr-defined]
+        "cameras/cam1",
+        method="patch",
+        json={
+            "recordingSettings": {"mode": "always", "prePaddingSecs": 5},
+            "name": "Test",
+        },
+    )
+    protect_client.api_request.assert_any_call(  # type: ignore[attr-defined]
+        "lights/light1",
+        method="patch",
+        json={"name": "Test"},
+    )
+
+    async def abort_batch() -> None:
+        async with protect_client.batch_updates():
+            await protect_client.update_device(
+                ModelType.LIGHT,
+                "light1",
+                {"name": "Test"},
+            )
+            raise ValueError("abort")
+
+    protect_client.api_request.reset_mock()  # type: ignore[attr-defined]
+    with pytest.raises(ValueError, match="abort"):
+        await abort_batch()
+
+    protect_client.api_request.assert_not_called()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio()
+async def test_batch_updates_other_task(protect_client: ProtectApiClient):
+    protect_client.api_request.reset_mock()  # type: ignore[attr-defined]
+    batch_open = asyncio.Event()
+    other_sent = asyncio.Event()
+
+    async def other_task() -> None:
+        await batch_open.wait()
+        await protect_client.update_device(ModelType.LIGHT, "light1", {"name": "Other"})
+        other_sent.set()
+
+    # created before the batch is opened, so it does not share its context
+    task = asyncio.create_task(other_task())
+    async with protect_client.batch_updates():
+        await protect_client.update_device(ModelType.CAMERA, "cam1", {"name": "Test"})
+        batch_open.set()
+        await other_sent.wait()
+
+        protect_client.api_request.assert_called_once_with(  # type: ignore[attr-defined]
+            "lights/light1",
+            method="patch",
+            json={"name": "Other"},
+        )
+
+    await task
+    assert protect_client.api_request.call_count == 2  # type: ignore[attr-defined]
+    protect_client.api_request.assert_called_with(  # type: ignore[attr-defined]
+        "cameras/cam1",
+        method="patch",
+        json={"name": "Test"},
+    )
+
+
+def test_subscribe_websocket(protect_client: ProtectApiClient):
+    callback = Mock()
+    msg = Mock()
+
+    unsub1 = protect_client.subscribe_websocket(callback)
+    unsub2 = protect_client.subscribe_websocket(callback)
+
+    def unsub_self(_msg: Any) -> None:
+        unsub3()
+
+    unsub3 = protect_client.subscribe_websocket(unsub_self)
+    other = Mock()
+    protect_client.subscribe_websocket(other)
+
+    protect_client.emit_message(msg)
+    assert callback.call_count == 2
+    other.assert_called_once_with(msg)
+
+    unsub1()
+    unsub1()
+    protect_client.emit_message(msg)
+    assert callback.call_count == 3
+    assert other.call_count == 2
+
+    unsub2()
+    protect_client.emit_message(msg)
+    assert callback.call_count == 3
+    assert len(protect_client._ws_subscriptions) == 1
+
+
 def test_connection_host(protect_client: ProtectApiClient):
     protect_client.bootstrap.nvr.hosts = [
         IPv4Address("192.168.1.1"),
@@ -366,6 +790,45 @@ async def test_get_events_raw_types(protect_client: ProtectApiClient):
     )
 
 
+@pytest.mark.asyncio()
+async def test_get_events_raw_paginate(protect_client: ProtectApiClient, now: datetime):
+    now_int = to_js_time(now)
+    all_events = [
+        {"id": str(i), "start": now_int - i * 1000, "end": now_int - i * 1000 + 500}
+        for i in range(650)
+    ]
+
+    async def get_page(url: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        offset = params["offset"]
+        return all_events[offset : offset + params["limit"]]
+
+    protect_client.api_request_list = AsyncMock(side_effect=get_page)  # type: ignore[method-assign]
+
+    start = now - timedelta(seconds=449.5)
+    events = await protect_client.get_events_raw(start=start, end=now, sorting="desc")
+
+    assert events == all_events[:450]
+    # 1 + 2 + 4 pages, last batch hits the start boundary
+    assert protect_client.api_request_list.call_count == 7
+
+    protect_client.api_request_list.reset_mock()
+    events = await protect_client.get_events_raw(
+        start=now - timedelta(days=1),
+        end=now,
+    )
+
+    assert events == list(reversed(all_events))
+
+    protect_client.api_request_list.reset_mock()
+    events = await protect_client.get_events_raw(
+        start=now - timedelta(seconds=199.5),
+        end=now - timedelta(seconds=49.5),
+        sorting="desc",
+    )
+
+    assert events == all_events[50:200]
+
+
 # test has a scaling "expected time to complete" based on the number of
 # events in the last 24 hours
 @pytest.mark.timeout(CONSTANTS["event_count"] * 0.1)  # type: ignore[misc]
@@ -395,6 +858,21 @@ async def test_get_events_not_event(protect_client: ProtectApiClient, camera):
     assert await protect_client.get_events() == []
 
 
+@pytest.mark.asyncio()
+async def test_get_events_default_types(protect_client: ProtectApiClient):
+    protect_client.get_events_raw = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+    await protect_client.get_events()
+    assert protect_client.get_events_raw.call_args.kwargs["types"] == [
+        EventType.MOTION,
+        EventType.RING,
+        EventType.SMART_DETECT,
+    ]
+
+    await protect_client.get_events(types=[EventType.RING])
+    assert protect_client.get_events_raw.call_args.kwargs["types"] == [EventType.RING]
+
+
 @pytest.mark.asyncio()
 async def test_get_events_not_event_with_type(protect_client: ProtectApiClient, camera):
     camera["type"] = EventType.MOTION.value
@@ -404,6 +882,28 @@ async def test_get_events_not_event_with_type(protect_client: ProtectApiClient,
     assert await protect_client.get_events() == []
 
 
+@pytest.mark.asyncio()
+async def test_get_device_raw_shared(protect_client: ProtectApiClient):
+    async def get_obj(url: str) -> dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return {"id": url, "nested": {"value": 1}}
+
+    protect_client.api_request_obj = AsyncMock(side_effect=get_obj)  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        *(protect_client.get_device_raw(ModelType.CAMERA, "test_id") for _ in range(3)),
+    )
+
+    protect_client.api_request_obj.assert_called_once_with("cameras/test_id")
+    assert all(r == {"id": "cameras/test_id", "nested": {"value": 1}} for r in results)
+    # every caller gets its own copy
+    assert len({id(r["nested"]) for r in results}) == 3
+    assert protect_client._inflight_requests == {}
+
+    await protect_client.get_device_raw(ModelType.CAMERA, "test_id")
+    assert protect_client.api_request_obj.call_count == 2
+
+
 @pytest.mark.skipif(not TEST_CAMERA_EXISTS, reason="Missing testdata")
 @pytest.mark.asyncio()
 async def test_get_device_mismatch(protect_client: ProtectApiClient, camera):
@@ -561,6 +1061,23 @@ async def test_get_liveviews(protect_client: ProtectApiClient, liveviews):
     assert objs == await protect_client.get_liveviews()
 
 
+@pytest.mark.skipif(not TEST_CHIME_EXISTS, reason="Missing testdata")
+@pytest.mark.asyncio()
+async def test_get_chimes(protect_client: ProtectApiClient, chimes):
+    objs = [create_from_unifi_dict(d) for d in chimes]
+
+    assert objs == await protect_client.get_chimes()
+
+
+@pytest.mark.asyncio()
+async def test_get_all_devices(protect_client: ProtectApiClient):
+    devices = await protect_client.get_all_devices()
+
+    assert set(devices) == set(DEVICE_MODEL_TYPES)
+    assert devices[ModelType.CAMERA] == await protect_client.get_cameras()
+    assert devices[ModelType.LIVEVIEW] == await protect_client.get_liveviews()
+
+
 @pytest.mark.skipif(not TEST_SNAPSHOT_EXISTS, reason="Missing testdata")
 @patch("pyunifiprotect.utils.datetime", MockDatetime)
 @pytest.mark.asyncio()
@@ -672,6 +1189,40 @@ async def test_get_camera_video(protect_client: ProtectApiClient, now, tmp_binar
     validate_video_file(tmp_binary_file.name, CONSTANTS["camera_video_length"])
 
 
+@pytest.mark.asyncio()
+async def test_get_camera_video_output_file(
+    protect_client: ProtectApiClient,
+    now,
+    tmp_path: Path,
+):
+    camera = next(iter(protect_client.bootstrap.cameras.values()))
+    chunks = [b"a" * 10, b"b" * 5]
+
+    async def iter_chunked(size: int):
+        for chunk in chunks:
+            yield chunk
+
+    response = MagicMock()
+    response.content_length = 15
+    response.content.iter_chunked = iter_chunked
+    protect_client.request = AsyncMock(return_value=response)  # type: ignore[method-assign]
+    progress = AsyncMock()
+    output_file = tmp_path / "video.mp4"
+
+    data = await protect_client.get_camera_video(
+        camera.id,
+        now - timedelta(seconds=10),
+        now,
+        output_file=output_file,
+        progress_callback=progress,
+    )
+
+    assert data is None
+    assert output_file.read_bytes() == b"a" * 10 + b"b" * 5
+    assert progress.call_args_list == [((10, 10, 15),), ((5, 15, 15),)]
+    response.close.assert_called_once()
+
+
 @pytest.mark.skipif(not TEST_THUMBNAIL_EXISTS, reason="Missing testdata")
 @pytest.mark.asyncio()
 async def test_get_event_thumbnail(protect_client: ProtectApiClient):
@@ -688,6 +1239,35 @@ async def test_get_event_thumbnail(protect_client: ProtectApiClient):
     assert img.format in {"PNG", "JPEG"}
 
 
+@pytest.mark.asyncio()
+async def test_get_event_thumbnail_retry(protect_client: ProtectApiClient):
+    protect_client.api_request_raw = AsyncMock(side_effect=[None, None, b"data"])  # type: ignore[method-assign]
+
+    with patch("pyunifiprotect.api.asyncio.sleep", AsyncMock()) as mock_sleep:
+        data = await protect_client.get_event_thumbnail("e-test_id")
+
+    assert data == b"data"
+    assert protect_client.api_request_raw.call_count == 3
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0.08 <= delays[0] <= 0.12
+    assert 0.12 <= delays[1] <= 0.18
+
+
+@pytest.mark.asyncio()
+async def test_get_event_animated_thumbnail(protect_client: ProtectApiClient):
+    protect_client.api_request_raw = AsyncMock(return_value=b"gif")  # type: ignore[method-assign]
+
+    data = await protect_client.get_event_animated_thumbnail("e-test_id", 640)
+    assert data == b"gif"
+
+    protect_client.api_request_raw.assert_called_with(
+        "events/test_id/animated-thumbnail",
+        params={"keyFrameOnly": "true", "speedup": 10, "w": 640},
+        raise_exception=False,
+    )
+
+
 @pytest.mark.skipif(not TEST_THUMBNAIL_EXISTS, reason="Missing testdata")
 @pytest.mark.asyncio()
 async def test_get_event_thumbnail_args(protect_client: ProtectApiClient):
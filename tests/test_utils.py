@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+from datetime import timedelta
+from ipaddress import IPv4Address
 from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
 
-from pyunifiprotect.utils import convert_unifi_data, dict_diff, to_snake_case
+from pyunifiprotect.utils import (
+    convert_unifi_data,
+    dict_diff,
+    from_ms,
+    get_response_reason,
+    ip_from_host,
+    to_snake_case,
+)
 
 try:
     from pydantic.v1.config import BaseConfig
@@ -114,6 +124,13 @@ def test_to_snake_case():
     assert to_snake_case("HTTPResponseCodeXYZ") == "http_response_code_xyz"
 
 
+def test_from_ms():
+    assert from_ms(0) == timedelta(0)
+    assert from_ms(1500) == timedelta(seconds=1.5)
+    assert from_ms(86_400_123) == timedelta(days=1, milliseconds=123)
+    assert from_ms(2.5) == timedelta(microseconds=2500)
+
+
 @pytest.mark.parametrize(
     ("value", "field", "output"),
     [
@@ -151,3 +168,30 @@ def test_to_snake_case():
 )
 def test_convert_unifi_data(value: Any, field: ModelField, output: Any):
     assert convert_unifi_data(value, field) == output
+
+
+def test_ip_from_host():
+    ip_from_host.cache_clear()
+
+    assert ip_from_host("192.168.1.1") == IPv4Address("192.168.1.1")
+
+    with patch(
+        "pyunifiprotect.utils.socket.gethostbyname",
+        return_value="192.168.1.2",
+    ) as mock_lookup:
+        assert ip_from_host("unifi.local") == IPv4Address("192.168.1.2")
+        assert ip_from_host("unifi.local") == IPv4Address("192.168.1.2")
+
+    mock_lookup.assert_called_once_with("unifi.local")
+    ip_from_host.cache_clear()
+
+
+@pytest.mark.asyncio()
+async def test_get_response_reason():
+    response = Mock(reason="Bad Request")
+    response.read = AsyncMock(return_value=b'{"error": "Invalid id"}')
+    assert await get_response_reason(response) == "Invalid id"
+
+    response.read = AsyncMock(return_value=b"<html>error</html>")
+    response.text = AsyncMock(return_value="<html>error</html>")
+    assert await get_response_reason(response) == "<html>error</html>"